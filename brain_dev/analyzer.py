@@ -15,6 +15,7 @@ to sort findings by relative importance — do not interpret 0.7 as
 
 import ast
 from dataclasses import dataclass, field
+import functools
 from typing import Any, Optional
 import hashlib
 import re
@@ -23,8 +24,15 @@ import re
 _RE_WORD_SPLIT = re.compile(r"[_\s]")
 _RE_TRAILING_DIGITS = re.compile(r"\d+$")
 
+# AST node types that each add +1 to the complexity score
+_COMPLEXITY_NODES = (
+    ast.If, ast.For, ast.While, ast.Try, ast.With, ast.ExceptHandler,
+    ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp,
+    ast.match_case,
+)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class CoverageGap:
     """A gap in test coverage."""
 
@@ -48,7 +56,7 @@ class CoverageGap:
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MissingBehavior:
     """A user behavior not captured in code/tests."""
 
@@ -70,7 +78,7 @@ class MissingBehavior:
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SuggestedUnitCase:
     """A suggested test case to write.
 
@@ -101,7 +109,7 @@ TestSuggestion = SuggestedUnitCase
 GeneratedTest = SuggestedUnitCase
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RefactorSuggestion:
     """A suggested refactoring."""
 
@@ -131,7 +139,7 @@ class RefactorSuggestion:
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UXInsight:
     """A UX insight from behavior analysis."""
 
@@ -162,6 +170,8 @@ class UXInsight:
 class CoverageAnalyzer:
     """Analyzes test coverage gaps."""
 
+    __slots__ = ("min_support",)
+
     def __init__(self, min_support: float = 0.05):
         self.min_support = min_support
 
@@ -180,17 +190,18 @@ class CoverageAnalyzer:
         Returns:
             List of coverage gaps
         """
-        test_pattern_set = {tuple(p) for p in test_patterns}
+        covered = frozenset(tuple(p) for p in test_patterns)
         gaps = []
 
         for pattern_data in observed_patterns:
-            pattern = tuple(pattern_data.get("sequence", []))
             support = pattern_data.get("support", 0)
 
             if support < self.min_support:
                 continue
 
-            if pattern not in test_pattern_set:
+            # Only materialize the tuple for patterns that pass the support filter
+            pattern = tuple(pattern_data.get("sequence", []))
+            if pattern not in covered:
                 gap = self._create_gap(pattern, support)
                 gaps.append(gap)
 
@@ -260,6 +271,8 @@ class CoverageAnalyzer:
 class BehaviorAnalyzer:
     """Analyzes user behavior patterns."""
 
+    __slots__ = ()
+
     def find_missing_behaviors(
         self,
         observed_patterns: list[dict],
@@ -336,6 +349,8 @@ class CodeTestGenerator:
     collection warnings when the class name starts with "Test".
     """
 
+    __slots__ = ()
+
     TEMPLATES = {
         "pytest": {
             "unit": '''
@@ -412,9 +427,29 @@ describe('{test_name}', () => {{
 TestGenerator = CodeTestGenerator
 
 
+@functools.lru_cache(maxsize=1024)
+def _complexity_score(source: str) -> int:
+    """Cached single-walk implementation of ``RefactorAnalyzer._ast_complexity``."""
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return 0
+
+    score = 0
+    for node in ast.walk(tree):
+        if isinstance(node, _COMPLEXITY_NODES):
+            score += 1
+        elif isinstance(node, ast.BoolOp):
+            # ``a and b`` has 2 values → +1; ``a and b and c`` → +2
+            score += len(node.values) - 1
+    return score
+
+
 class RefactorAnalyzer:
     """Analyzes code for refactoring opportunities."""
 
+    __slots__ = ()
+
     def analyze_code(
         self,
         symbols: list[dict],
@@ -449,36 +484,14 @@ class RefactorAnalyzer:
 
         Complexity formula (inspired by cyclomatic complexity):
           +1 for each: If, For, While, Try, With, ExceptHandler,
-                       match/case (MatchCase — Python 3.10+)
+                       match/case arm (``ast.match_case``)
           +1 per additional operand in BoolOp (``a and b and c`` = +2)
           +1 for each comprehension node (ListComp, SetComp, DictComp, GeneratorExp)
 
         Returns 0 when the source cannot be parsed as valid Python.
+        Scores are memoized per source string.
         """
-        try:
-            tree = ast.parse(source)
-        except SyntaxError:
-            return 0
-
-        score = 0
-        for node in ast.walk(tree):
-            if isinstance(node, (
-                ast.If, ast.For, ast.While, ast.Try,
-                ast.With, ast.ExceptHandler,
-            )):
-                score += 1
-            elif isinstance(node, ast.BoolOp):
-                # ``a and b`` has 2 values → +1; ``a and b and c`` → +2
-                score += len(node.values) - 1
-            elif isinstance(node, (
-                ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp,
-            )):
-                score += 1
-            # Python 3.10+ match/case
-            elif hasattr(ast, "MatchCase") and isinstance(node, ast.MatchCase):
-                score += 1
-
-        return score
+        return _complexity_score(source)
 
     def _analyze_complexity(self, symbols: list[dict]) -> list[RefactorSuggestion]:
         """Find overly complex functions using AST-based complexity scoring."""
@@ -562,6 +575,8 @@ class RefactorAnalyzer:
 class UXAnalyzer:
     """Analyzes UX patterns from user behavior."""
 
+    __slots__ = ()
+
     def analyze_flow(
         self,
         patterns: list[dict],
@@ -594,23 +609,21 @@ class UXAnalyzer:
         """Find high-dropoff points in flows."""
         insights = []
 
+        # Materialize each (sequence, count) once; both passes reuse it
+        rows = [
+            (tuple(pattern.get("sequence", [])), pattern.get("occurrence_count", 0))
+            for pattern in patterns
+        ]
+
         # Group patterns by prefix
         prefix_counts: dict[tuple, int] = {}
-        for pattern in patterns:
-            seq = tuple(pattern.get("sequence", []))
-            count = pattern.get("occurrence_count", 0)
-
+        for seq, count in rows:
             for i in range(1, len(seq)):
                 prefix = seq[:i]
-                if prefix not in prefix_counts:
-                    prefix_counts[prefix] = 0
-                prefix_counts[prefix] += count
+                prefix_counts[prefix] = prefix_counts.get(prefix, 0) + count
 
         # Find where counts drop significantly
-        for pattern in patterns:
-            seq = tuple(pattern.get("sequence", []))
-            count = pattern.get("occurrence_count", 0)
-
+        for seq, count in rows:
             for i in range(1, len(seq)):
                 prefix = seq[:i]
                 prefix_count = prefix_counts.get(prefix, 0)
@@ -656,7 +669,7 @@ class UXAnalyzer:
         return insights
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DocSuggestion:
     """A documentation suggestion."""
 
@@ -686,7 +699,7 @@ class DocSuggestion:
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SecurityIssue:
     """A security issue found in code."""
 
@@ -718,9 +731,61 @@ class SecurityIssue:
         }
 
 
+# Underscore-prefixed names that DocsAnalyzer still documents
+_DOC_DUNDER_ALLOW: frozenset[str] = frozenset({"__init__"})
+
+
+# Bounded: symbol_type and doc_style arrive as free-form tool arguments
+@functools.lru_cache(maxsize=32)
+def _doc_template_skeleton(symbol_type: str, doc_style: str) -> str:
+    """Cached docstring template with a ``{name}`` placeholder."""
+    if doc_style == "google":
+        if symbol_type == "function":
+            return '''"""Brief description of {name}.
+
+Args:
+    param1: Description of param1.
+
+Returns:
+    Description of return value.
+
+Raises:
+    ExceptionType: When this exception is raised.
+"""'''
+        elif symbol_type == "class":
+            return '''"""Brief description of {name}.
+
+Attributes:
+    attr1: Description of attr1.
+"""'''
+    return '"""Document {name}."""'
+
+
+@functools.lru_cache(maxsize=1024)
+def _doc_completeness_issues(docstring: str, symbol_type: str) -> tuple[str, ...]:
+    """Cached implementation of ``DocsAnalyzer._check_doc_completeness``."""
+    issues = []
+    doc_lower = docstring.lower()
+
+    if symbol_type == "function":
+        # Check for Args section if function likely has parameters
+        if "args:" not in doc_lower and "parameters:" not in doc_lower:
+            issues.append("Args/Parameters section")
+        if "returns:" not in doc_lower and "return" not in doc_lower:
+            issues.append("Returns section")
+
+    # Check for very short docstrings
+    if len(docstring.strip()) < 20:
+        issues.append("detailed description")
+
+    return tuple(issues)
+
+
 class DocsAnalyzer:
     """Analyzes code for documentation opportunities."""
 
+    __slots__ = ()
+
     def analyze_docs(
         self,
         symbols: list[dict],
@@ -746,7 +811,7 @@ class DocsAnalyzer:
             line = symbol.get("line", 0)
 
             # Skip private/dunder methods (except __init__)
-            if name.startswith("_") and name != "__init__":
+            if name.startswith("_") and name not in _DOC_DUNDER_ALLOW:
                 continue
 
             suggestion = self._analyze_symbol_docs(
@@ -771,7 +836,7 @@ class DocsAnalyzer:
         location = f"{file_path}:{line}"
 
         # Missing docstring
-        if not docstring:
+        if not docstring or docstring.isspace():
             return DocSuggestion(
                 suggestion_id=f"doc_{suggestion_id}",
                 symbol_name=name,
@@ -801,54 +866,84 @@ class DocsAnalyzer:
         self, name: str, symbol_type: str, doc_style: str
     ) -> str:
         """Generate a documentation template."""
-        if doc_style == "google":
-            if symbol_type == "function":
-                return f'''"""Brief description of {name}.
+        return _doc_template_skeleton(symbol_type, doc_style).format(name=name)
 
-Args:
-    param1: Description of param1.
+    def _check_doc_completeness(
+        self, docstring: str, symbol_type: str
+    ) -> tuple[str, ...]:
+        """Check if docstring is complete.
 
-Returns:
-    Description of return value.
+        Results are memoized per (docstring, symbol_type); stub docstrings
+        recur across many symbols.
+        """
+        return _doc_completeness_issues(docstring, symbol_type)
 
-Raises:
-    ExceptionType: When this exception is raised.
-"""'''
-            elif symbol_type == "class":
-                return f'''"""Brief description of {name}.
 
-Attributes:
-    attr1: Description of attr1.
-"""'''
-        return f'"""Document {name}."""'
+# Severity name → rank, used for threshold filtering and ordering
+_SEVERITY_RANK: dict[str, int] = {"low": 0, "medium": 1, "high": 2, "critical": 3}
 
-    def _check_doc_completeness(self, docstring: str, symbol_type: str) -> list[str]:
-        """Check if docstring is complete."""
-        issues = []
-        doc_lower = docstring.lower()
 
-        if symbol_type == "function":
-            # Check for Args section if function likely has parameters
-            if "args:" not in doc_lower and "parameters:" not in doc_lower:
-                issues.append("Args/Parameters section")
-            if "returns:" not in doc_lower and "return" not in doc_lower:
-                issues.append("Returns section")
+def _compile_patterns(raw: list[str]) -> list[re.Pattern[str]]:
+    """Compile a list of regex strings once at import time."""
+    return [re.compile(p, re.IGNORECASE) for p in raw]
 
-        # Check for very short docstrings
-        if len(docstring.strip()) < 20:
-            issues.append("detailed description")
 
-        return issues
+_REGEX_META = frozenset("\\.^$*+?{}[]|()")
 
 
-def _compile_patterns(raw: list[str]) -> list[re.Pattern[str]]:
-    """Compile a list of regex strings once at import time."""
-    return [re.compile(p, re.IGNORECASE) for p in raw]
+def _literal_prefix(pattern: str) -> str:
+    """Return the casefolded literal text every match of *pattern* starts with.
+
+    Reads plain characters and escaped punctuation (``\\.``, ``\\(``) up to
+    the first metacharacter. A character followed by a quantifier is optional,
+    so it is dropped. Returns ``""`` when the pattern has no literal prefix or
+    has a top-level ``|``, which would make the prefix optional too.
+
+    The anchor is only a sound filter for ASCII sources: ``re.IGNORECASE``
+    also matches non-ASCII case variants (``ı``, ``ſ``, the Kelvin sign) that
+    casefolding does not map onto the ASCII letters in the anchor.
+    """
+    depth = 0
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if in_class:
+            in_class = ch != "]"
+        elif ch == "[":
+            in_class = True
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "|" and depth == 0:
+            return ""
+        i += 1
+
+    prefix: list[str] = []
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\" and i + 1 < len(pattern) and pattern[i + 1] in _REGEX_META:
+            literal, i = pattern[i + 1], i + 2
+        elif ch not in _REGEX_META:
+            literal, i = ch, i + 1
+        else:
+            break
+        if i < len(pattern) and pattern[i] in "?*{":
+            break
+        prefix.append(literal)
+    return "".join(prefix).casefold()
 
 
 class SecurityAnalyzer:
     """Analyzes code for security vulnerabilities."""
 
+    __slots__ = ()
+
     # Precompiled security patterns — compiled once at class-definition time
     # to avoid re-compilation inside hot loops.
     SECURITY_PATTERNS: dict[str, dict[str, Any]] = {
@@ -961,6 +1056,35 @@ class SecurityAnalyzer:
         },
     }
 
+    # SECURITY_PATTERNS flattened to one row per pattern:
+    # (compiled, category, severity, severity_rank, cwe, recommendation,
+    # description, anchor), where anchor is literal text every match must
+    # contain (casefolded). Issues reference these strings rather than
+    # building their own copies.
+    _PATTERN_TABLE: tuple[
+        tuple[re.Pattern[str], str, str, int, Optional[str], str, str, str], ...
+    ] = tuple(
+        (
+            pattern, category, cfg["severity"], _SEVERITY_RANK[cfg["severity"]],
+            cfg.get("cwe"), cfg["recommendation"],
+            f"Potential {category.replace('_', ' ')} vulnerability detected",
+            _literal_prefix(pattern.pattern),
+        )
+        for category, cfg in SECURITY_PATTERNS.items()
+        for pattern in cfg["patterns"]
+    )
+
+    # All patterns fused into one alternation. A single scan tells whether any
+    # pattern can match; only then is the table walked to find which ones.
+    _ANY_PATTERN: re.Pattern[str] = re.compile(
+        "|".join(f"(?:{row[0].pattern})" for row in _PATTERN_TABLE),
+        re.IGNORECASE,
+    )
+
+    # Shortest text any pattern or sink can match (``md5(``, ``DES.``);
+    # anything shorter is skipped without scanning.
+    _MIN_MATCH_LEN = 4
+
     # Sink functions where dynamic strings indicate injection risk.
     # Maps (object_attr_or_name) → (category, severity, cwe, recommendation).
     _INJECTION_SINKS: dict[str, tuple[str, str, str, str]] = {
@@ -990,6 +1114,12 @@ class SecurityAnalyzer:
         ),
     }
 
+    # Final name component of every sink. A source that contains none of
+    # these cannot produce an AST finding, so it is never parsed.
+    _SINK_NAMES: frozenset[str] = frozenset(
+        name.rsplit(".", 1)[-1] for name in _INJECTION_SINKS
+    )
+
     @staticmethod
     def _is_dynamic_string(node: ast.expr) -> Optional[str]:
         """Return a human-readable reason if *node* builds a string dynamically.
@@ -1047,6 +1177,9 @@ class SecurityAnalyzer:
         * ``cursor.execute("..." + user_input)``
         * ``cursor.execute("...".format(user_input))``
         """
+        if not any(name in source for name in self._SINK_NAMES):
+            return []
+
         try:
             tree = ast.parse(source)
         except SyntaxError:
@@ -1121,14 +1254,15 @@ class SecurityAnalyzer:
         Returns:
             List of security issues found
         """
-        severity_order = {"low": 0, "medium": 1, "high": 2, "critical": 3}
-        threshold = severity_order.get(severity_threshold, 0)
+        threshold = _SEVERITY_RANK.get(severity_threshold, 0)
 
-        issues = []
+        # One bucket per severity rank; emitting straight into them keeps the
+        # result ordered by severity (and stable within it) without a sort.
+        buckets: tuple[list[SecurityIssue], ...] = ([], [], [], [])
 
         for symbol in symbols:
-            source = symbol.get("source_code", "")
-            if not source:
+            source = symbol.get("source_code") or ""
+            if len(source) < self._MIN_MATCH_LEN:
                 continue
 
             file_path = symbol.get("file_path", "")
@@ -1138,40 +1272,45 @@ class SecurityAnalyzer:
             ast_issues = self._ast_detect_injections(source, file_path, line)
             ast_categories = {i.category for i in ast_issues}
             for issue in ast_issues:
-                if severity_order.get(issue.severity, 0) >= threshold:
-                    issues.append(issue)
+                rank = _SEVERITY_RANK.get(issue.severity, 0)
+                if rank >= threshold:
+                    buckets[rank].append(issue)
 
             # --- Phase 2: Regex fallback for remaining categories ---
-            for category, config in self.SECURITY_PATTERNS.items():
+            if not self._ANY_PATTERN.search(source):
+                continue
+
+            # Anchors are only sound on ASCII text (see _literal_prefix)
+            folded = source.casefold() if source.isascii() else None
+            for (
+                compiled_pat, category, severity, rank, cwe, recommendation,
+                description, anchor,
+            ) in self._PATTERN_TABLE:
                 if category in ast_categories:
                     continue  # AST already covered this category
 
-                if severity_order.get(config["severity"], 0) < threshold:
+                if rank < threshold:
                     continue
 
-                for compiled_pat in config["patterns"]:
-                    matches = compiled_pat.finditer(source)
-                    for match in matches:
-                        issue_id = hashlib.md5(
-                            f"{file_path}:{line}:{category}".encode()
-                        ).hexdigest()[:8]
-
-                        issues.append(SecurityIssue(
-                            issue_id=f"sec_{issue_id}",
-                            severity=config["severity"],
-                            category=category,
-                            location=f"{file_path}:{line}",
-                            description=f"Potential {category.replace('_', ' ')} vulnerability detected",
-                            recommendation=config["recommendation"],
-                            signal_strength=0.7,
-                            cwe_id=config.get("cwe"),
-                        ))
-                        break  # One issue per category per symbol
+                # Cheap substring check before running the regex
+                if folded is not None and anchor not in folded:
+                    continue
 
-        # Sort by severity
-        issues.sort(
-            key=lambda i: severity_order.get(i.severity, 0),
-            reverse=True,
-        )
+                # One issue per matching pattern per symbol
+                if compiled_pat.search(source):
+                    issue_id = hashlib.md5(
+                        f"{file_path}:{line}:{category}".encode()
+                    ).hexdigest()[:8]
 
-        return issues
+                    buckets[rank].append(SecurityIssue(
+                        issue_id=f"sec_{issue_id}",
+                        severity=severity,
+                        category=category,
+                        location=f"{file_path}:{line}",
+                        description=description,
+                        recommendation=recommendation,
+                        signal_strength=0.7,
+                        cwe_id=cwe,
+                    ))
+
+        return [*buckets[3], *buckets[2], *buckets[1], *buckets[0]]
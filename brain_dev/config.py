@@ -1,13 +1,18 @@
 """Configuration for Dev Brain MCP Server."""
 
+import functools
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DevBrainConfig:
-    """Configuration for the Dev Brain server."""
+    """Configuration for the Dev Brain server.
+
+    Instances are immutable so that the cached result of ``load_config``
+    can be shared safely between callers.
+    """
 
     # Server identity
     server_name: str = "brain-dev"
@@ -43,10 +48,14 @@ class DevBrainConfig:
     max_file_bytes: int = 2_000_000  # 2 MB default cap for source files
 
 
+@functools.lru_cache(maxsize=8)
 def load_config(config_path: Optional[Path] = None) -> DevBrainConfig:
     """
     Load configuration from file or environment.
 
+    Results are memoized per ``config_path``; repeated calls return the
+    same (immutable) instance.
+
     Args:
         config_path: Optional path to config file
 
@@ -26,18 +26,7 @@ from mcp.types import (
 )
 from mcp.server.lowlevel.server import ReadResourceContents
 
-from .config import DevBrainConfig
-from .analyzer import (
-    CoverageAnalyzer,
-    BehaviorAnalyzer,
-    TestGenerator,
-    RefactorAnalyzer,
-    UXAnalyzer,
-    DocsAnalyzer,
-    SecurityAnalyzer,
-    CoverageGap,
-)
-from .smart_test_generator import generate_tests_for_file
+from .config import DevBrainConfig, load_config
 
 
 # =========================================================================
@@ -82,12 +71,9 @@ def require_str(args: dict, key: str) -> str:
     return value
 
 
-def _validation_error(message: str) -> list[TextContent]:
-    """Return a consistent MCP-friendly validation error."""
-    return [TextContent(
-        type="text",
-        text=json.dumps({"error": message, "success": False}),
-    )]
+def _validation_error(message: str) -> dict[str, Any]:
+    """Return a consistent MCP-friendly validation error payload."""
+    return {"error": message, "success": False}
 
 
 # =========================================================================
@@ -310,38 +296,42 @@ def create_server(config: Optional[DevBrainConfig] = None) -> Server:
     Create and configure the Dev Brain MCP server.
 
     Args:
-        config: Configuration (uses defaults if None)
+        config: Configuration (uses the shared load_config() defaults if None)
 
     Returns:
         Configured MCP Server
     """
-    config = config or DevBrainConfig()
+    config = config or load_config()
     server = Server(config.server_name)
 
-    # Lazy-singleton registry: one cache + constructor map replaces 7 nonlocal blocks
+    # Lazy-singleton registry: one cache + constructor map replaces 7 nonlocal blocks.
+    # Constructors receive the analyzer module, which is only imported on the
+    # first tool call so that creating the server stays cheap.
     _service_cache: dict[str, Any] = {}
     _service_constructors: dict[str, Any] = {
-        "coverage_analyzer": lambda: CoverageAnalyzer(min_support=config.min_gap_support),
-        "behavior_analyzer": BehaviorAnalyzer,
-        "test_generator": TestGenerator,
-        "refactor_analyzer": RefactorAnalyzer,
-        "ux_analyzer": UXAnalyzer,
-        "docs_analyzer": DocsAnalyzer,
-        "security_analyzer": SecurityAnalyzer,
+        "coverage_analyzer": lambda m: m.CoverageAnalyzer(min_support=config.min_gap_support),
+        "behavior_analyzer": lambda m: m.BehaviorAnalyzer(),
+        "test_generator": lambda m: m.TestGenerator(),
+        "refactor_analyzer": lambda m: m.RefactorAnalyzer(),
+        "ux_analyzer": lambda m: m.UXAnalyzer(),
+        "docs_analyzer": lambda m: m.DocsAnalyzer(),
+        "security_analyzer": lambda m: m.SecurityAnalyzer(),
     }
 
     def _get_service(name: str) -> Any:
         """Return the cached singleton for *name*, creating it on first access."""
         if name not in _service_cache:
+            from . import analyzer
+
             constructor = _service_constructors[name]
-            _service_cache[name] = constructor()
+            _service_cache[name] = constructor(analyzer)
         return _service_cache[name]
 
     # =========================================================================
     # Tool Handlers
     # =========================================================================
 
-    def handle_coverage_analyze(args: dict) -> list[TextContent]:
+    def handle_coverage_analyze(args: dict) -> dict[str, Any]:
         """Handle coverage_analyze tool."""
         try:
             patterns = require_list(args, "patterns")
@@ -364,18 +354,15 @@ def create_server(config: Optional[DevBrainConfig] = None) -> Server:
         covered = total_patterns - len(gaps)
         coverage_pct = (covered / total_patterns * 100) if total_patterns > 0 else 0
 
-        return [TextContent(
-            type="text",
-            text=json.dumps({
-                "total_flows": total_patterns,
-                "covered_flows": covered,
-                "coverage_percentage": round(coverage_pct, 1),
-                "gaps_found": len(gaps),
-                "gaps": [g.to_dict() for g in gaps[:config.max_suggestions]],
-            })
-        )]
+        return {
+            "total_flows": total_patterns,
+            "covered_flows": covered,
+            "coverage_percentage": round(coverage_pct, 1),
+            "gaps_found": len(gaps),
+            "gaps": [g.to_dict() for g in gaps[:config.max_suggestions]],
+        }
 
-    def handle_behavior_missing(args: dict) -> list[TextContent]:
+    def handle_behavior_missing(args: dict) -> dict[str, Any]:
         """Handle behavior_missing tool."""
         try:
             patterns = require_list(args, "patterns")
@@ -389,15 +376,12 @@ def create_server(config: Optional[DevBrainConfig] = None) -> Server:
 
         missing = analyzer.find_missing_behaviors(patterns, code_symbols, min_count)
 
-        return [TextContent(
-            type="text",
-            text=json.dumps({
-                "missing_behaviors": [m.to_dict() for m in missing[:config.max_suggestions]],
-                "total_found": len(missing),
-            })
-        )]
+        return {
+            "missing_behaviors": [m.to_dict() for m in missing[:config.max_suggestions]],
+            "total_found": len(missing),
+        }
 
-    def handle_tests_generate(args: dict) -> list[TextContent]:
+    def handle_tests_generate(args: dict) -> dict[str, Any]:
         """Handle tests_generate tool."""
         try:
             gap_data = require_dict(args, "gap")
@@ -412,6 +396,8 @@ def create_server(config: Optional[DevBrainConfig] = None) -> Server:
         # Convert gap data to CoverageGap
         import hashlib
 
+        from .analyzer import CoverageGap
+
         pattern = gap_data.get("pattern", [])
         support = gap_data.get("support", 0.1)
 
@@ -427,12 +413,9 @@ def create_server(config: Optional[DevBrainConfig] = None) -> Server:
 
         suggestion = generator.generate_test(gap, framework, style)
 
-        return [TextContent(
-            type="text",
-            text=json.dumps(suggestion.to_dict())
-        )]
+        return suggestion.to_dict()
 
-    def handle_refactor_suggest(args: dict) -> list[TextContent]:
+    def handle_refactor_suggest(args: dict) -> dict[str, Any]:
         """Handle refactor_suggest tool."""
         try:
             symbols = require_list(args, "symbols")
@@ -455,15 +438,12 @@ def create_server(config: Optional[DevBrainConfig] = None) -> Server:
         # Sort by confidence
         suggestions.sort(key=lambda s: s.confidence, reverse=True)
 
-        return [TextContent(
-            type="text",
-            text=json.dumps({
-                "suggestions": [s.to_dict() for s in suggestions[:config.max_suggestions]],
-                "total_found": len(suggestions),
-            })
-        )]
+        return {
+            "suggestions": [s.to_dict() for s in suggestions[:config.max_suggestions]],
+            "total_found": len(suggestions),
+        }
 
-    def handle_ux_insights(args: dict) -> list[TextContent]:
+    def handle_ux_insights(args: dict) -> dict[str, Any]:
         """Handle ux_insights tool."""
         try:
             patterns = require_list(args, "patterns")
@@ -486,36 +466,33 @@ def create_server(config: Optional[DevBrainConfig] = None) -> Server:
         # Sort by confidence
         insights.sort(key=lambda i: i.confidence, reverse=True)
 
-        return [TextContent(
-            type="text",
-            text=json.dumps({
-                "insights": [i.to_dict() for i in insights[:config.max_suggestions]],
-                "total_found": len(insights),
-                "flow_type": flow_type,
-                "metric": metric,
-            })
-        )]
+        return {
+            "insights": [i.to_dict() for i in insights[:config.max_suggestions]],
+            "total_found": len(insights),
+            "flow_type": flow_type,
+            "metric": metric,
+        }
 
-    def handle_brain_stats(args: dict) -> list[TextContent]:
+    def handle_brain_stats(args: dict) -> dict[str, Any]:
         """Handle brain_stats tool."""
-        return [TextContent(
-            type="text",
-            text=json.dumps({
-                "server_name": config.server_name,
-                "server_version": config.server_version,
-                "min_gap_support": config.min_gap_support,
-                "min_signal_strength": config.min_signal_strength,
-                "min_confidence": config.min_confidence,  # deprecated alias
-                "max_suggestions": config.max_suggestions,
-                "default_test_framework": config.default_test_framework,
-                "tools_available": len(TOOL_DEFINITIONS),
-            })
-        )]
-
-    def handle_smart_tests_generate(args: dict) -> list[TextContent]:
+        return {
+            "server_name": config.server_name,
+            "server_version": config.server_version,
+            "min_gap_support": config.min_gap_support,
+            "min_signal_strength": config.min_signal_strength,
+            "min_confidence": config.min_confidence,  # deprecated alias
+            "max_suggestions": config.max_suggestions,
+            "default_test_framework": config.default_test_framework,
+            "tools_available": len(TOOL_DEFINITIONS),
+        }
+
+    def handle_smart_tests_generate(args: dict) -> dict[str, Any]:
         """Handle smart_tests_generate tool."""
         from pathlib import Path
 
+        # Imported on first use so other tools never load the generator
+        from .smart_test_generator import generate_tests_for_file
+
         try:
             file_path = require_str(args, "file_path")
         except ToolInputError as e:
@@ -526,33 +503,24 @@ def create_server(config: Optional[DevBrainConfig] = None) -> Server:
             resolved_path = Path(file_path).resolve()
             file_name = resolved_path.name  # Safe: only the filename for error messages
         except (ValueError, OSError):
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "error": "Invalid file path provided",
-                    "success": False,
-                })
-            )]
+            return {
+                "error": "Invalid file path provided",
+                "success": False,
+            }
 
         # Validate it's a Python file
         if not file_name.endswith(".py"):
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "error": "File must be a Python (.py) file",
-                    "success": False,
-                })
-            )]
+            return {
+                "error": "File must be a Python (.py) file",
+                "success": False,
+            }
 
         # Validate file exists
         if not resolved_path.is_file():
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "error": f"File not found: {file_name}",
-                    "success": False,
-                })
-            )]
+            return {
+                "error": f"File not found: {file_name}",
+                "success": False,
+            }
 
         try:
             # Generate tests using the smart test generator
@@ -561,52 +529,40 @@ def create_server(config: Optional[DevBrainConfig] = None) -> Server:
                 max_file_bytes=config.max_file_bytes,
             )
 
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "file_path": str(resolved_path),
-                    "file_name": file_name,
-                    "test_code": test_code,
-                    "lines": len(test_code.split("\n")),
-                })
-            )]
+            return {
+                "success": True,
+                "file_path": str(resolved_path),
+                "file_name": file_name,
+                "test_code": test_code,
+                "lines": len(test_code.split("\n")),
+            }
         except ValueError as e:
             # Handle file-size limits and other validation errors
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "error": str(e),
-                    "success": False,
-                    "file_path": str(resolved_path),
-                    "file_name": file_name,
-                })
-            )]
+            return {
+                "error": str(e),
+                "success": False,
+                "file_path": str(resolved_path),
+                "file_name": file_name,
+            }
         except SyntaxError as e:
             # Handle Python syntax errors in the source file
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "error": f"Syntax error in source file: {e.msg}",
-                    "success": False,
-                    "file_path": str(resolved_path),
-                    "file_name": file_name,
-                })
-            )]
+            return {
+                "error": f"Syntax error in source file: {e.msg}",
+                "success": False,
+                "file_path": str(resolved_path),
+                "file_name": file_name,
+            }
         except Exception as e:
             # Sanitize error message - don't expose internal paths or stack traces
             error_type = type(e).__name__
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "error": f"Failed to generate tests: {error_type}",
-                    "success": False,
-                    "file_path": str(resolved_path),
-                    "file_name": file_name,
-                })
-            )]
-
-    def handle_docs_generate(args: dict) -> list[TextContent]:
+            return {
+                "error": f"Failed to generate tests: {error_type}",
+                "success": False,
+                "file_path": str(resolved_path),
+                "file_name": file_name,
+            }
+
+    def handle_docs_generate(args: dict) -> dict[str, Any]:
         """Handle docs_generate tool."""
         try:
             symbols = require_list(args, "symbols")
@@ -619,16 +575,13 @@ def create_server(config: Optional[DevBrainConfig] = None) -> Server:
 
         suggestions = analyzer.analyze_docs(symbols, doc_style)
 
-        return [TextContent(
-            type="text",
-            text=json.dumps({
-                "suggestions": [s.to_dict() for s in suggestions[:config.max_suggestions]],
-                "total_found": len(suggestions),
-                "doc_style": doc_style,
-            })
-        )]
+        return {
+            "suggestions": [s.to_dict() for s in suggestions[:config.max_suggestions]],
+            "total_found": len(suggestions),
+            "doc_style": doc_style,
+        }
 
-    def handle_security_audit(args: dict) -> list[TextContent]:
+    def handle_security_audit(args: dict) -> dict[str, Any]:
         """Handle security_audit tool."""
         try:
             symbols = require_list(args, "symbols")
@@ -646,15 +599,12 @@ def create_server(config: Optional[DevBrainConfig] = None) -> Server:
         for issue in issues:
             severity_counts[issue.severity] = severity_counts.get(issue.severity, 0) + 1
 
-        return [TextContent(
-            type="text",
-            text=json.dumps({
-                "issues": [i.to_dict() for i in issues[:config.max_suggestions]],
-                "total_found": len(issues),
-                "severity_counts": severity_counts,
-                "severity_threshold": severity_threshold,
-            })
-        )]
+        return {
+            "issues": [i.to_dict() for i in issues[:config.max_suggestions]],
+            "total_found": len(issues),
+            "severity_counts": severity_counts,
+            "severity_threshold": severity_threshold,
+        }
 
     # =========================================================================
     # Tool Registry — single source of truth for name → handler dispatch
@@ -686,12 +636,13 @@ def create_server(config: Optional[DevBrainConfig] = None) -> Server:
         """Dispatch tool calls via the handler registry.
 
         The outer function must be async (MCP protocol requirement).
-        Individual handlers are sync since they do CPU-bound work only.
+        Individual handlers are sync since they do CPU-bound work only,
+        and return plain dicts that are serialized to JSON here.
         """
         handler = _tool_handlers.get(name)
         if handler is None:
             return [TextContent(type="text", text=f"Unknown tool: {name}")]
-        return handler(arguments)
+        return [TextContent(type="text", text=json.dumps(handler(arguments)))]
 
     # =========================================================================
     # Resources
@@ -727,8 +678,9 @@ def create_server(config: Optional[DevBrainConfig] = None) -> Server:
             mime_type="application/json",
         )]
 
-    # Expose service factory for testing (not part of MCP protocol)
+    # Expose service factory and raw handlers for testing (not part of MCP protocol)
     server._get_service = _get_service  # type: ignore[attr-defined]
+    server._tool_impls = _tool_handlers  # type: ignore[attr-defined]
 
     return server
 
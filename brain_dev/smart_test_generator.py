@@ -15,8 +15,12 @@ References:
 """
 
 import ast
+import hashlib
 import re
-from dataclasses import dataclass, field
+import sys
+import threading
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
@@ -24,6 +28,10 @@ from typing import Any, Optional
 _RE_RAISES = re.compile(r'(?:raises?|Raises?)[:\s]+(\w+)')
 _RE_OPTIONAL_RETURN = re.compile(r"Optional\[(.+)\]$")
 
+# Fields that hold nested statements (if/try/with/match blocks, handlers).
+# Everything CodeAnalyzer collects is a statement, so expressions are skipped.
+_BLOCK_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+
 
 @dataclass
 class Parameter:
@@ -97,7 +105,7 @@ class CodeAnalyzer(ast.NodeVisitor):
     - Docstrings and decorators
     """
 
-    def __init__(self, source_code: str, file_path: str = ""):
+    def __init__(self, source_code: str | bytes, file_path: str = ""):
         self.source_code = source_code
         self.file_path = file_path
         self.module_name = self._detect_module_path(file_path) if file_path else "module"
@@ -150,7 +158,6 @@ class CodeAnalyzer(ast.NodeVisitor):
                 alias=alias.asname,
                 is_from_import=False,
             ))
-        self.generic_visit(node)
 
     def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
         """Handle from ... import statements."""
@@ -161,7 +168,14 @@ class CodeAnalyzer(ast.NodeVisitor):
             names=names,
             is_from_import=True,
         ))
-        self.generic_visit(node)
+
+    def generic_visit(self, node: ast.AST) -> None:
+        """Descend into nested statement blocks only, never expressions."""
+        for name in _BLOCK_FIELDS:
+            children = getattr(node, name, None)
+            if isinstance(children, list):
+                for child in children:
+                    self.visit(child)
 
     def visit_ClassDef(self, node: ast.ClassDef) -> None:
         """Handle class definitions."""
@@ -229,8 +243,11 @@ class CodeAnalyzer(ast.NodeVisitor):
         if node.returns:
             return_annotation = self._annotation_to_string(node.returns)
 
+        # Docstring is read once and shared with raise detection
+        docstring = ast.get_docstring(node)
+
         # Detect raises from docstring or body
-        raises = self._detect_raises(node)
+        raises = self._detect_raises(node, docstring)
 
         func_info = FunctionInfo(
             name=node.name,
@@ -242,7 +259,7 @@ class CodeAnalyzer(ast.NodeVisitor):
             is_staticmethod="staticmethod" in decorators,
             is_property="property" in decorators,
             decorators=decorators,
-            docstring=ast.get_docstring(node),
+            docstring=docstring,
             raises=raises,
             line_number=node.lineno,
             class_name=self._current_class.name if self._current_class else None,
@@ -375,13 +392,20 @@ class CodeAnalyzer(ast.NodeVisitor):
             return f"{func}()"
         return "..."
 
-    def _detect_raises(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> list[str]:
-        """Detect exceptions raised by a function."""
+    def _detect_raises(
+        self,
+        node: ast.FunctionDef | ast.AsyncFunctionDef,
+        docstring: Optional[str] = None,
+    ) -> list[str]:
+        """Detect exceptions raised by a function.
+
+        ``docstring`` is the already-extracted docstring of *node*, if any.
+        """
         raises = []
 
         # Check docstring for :raises: or Raises: sections
-        docstring = ast.get_docstring(node) or ""
-        raises.extend(_RE_RAISES.findall(docstring))
+        if docstring:
+            raises.extend(_RE_RAISES.findall(docstring))
 
         # Check body for raise statements
         for child in ast.walk(node):
@@ -400,7 +424,7 @@ class MockDetector:
     """
 
     # Common patterns that typically need mocking
-    MOCK_PATTERNS = {
+    MOCK_PATTERNS: frozenset[str] = frozenset({
         # External services
         "requests", "httpx", "aiohttp", "urllib",
         # Databases
@@ -413,10 +437,10 @@ class MockDetector:
         "asyncio.sleep",
         # Third party
         "gradio", "websockets",
-    }
+    })
 
     # Known async libraries
-    ASYNC_LIBS = {"asyncio", "aiohttp", "websockets", "aiofiles"}
+    ASYNC_LIBS: frozenset[str] = frozenset({"asyncio", "aiohttp", "websockets", "aiofiles"})
 
     # Standard-library top-level module names that should NOT be mocked.
     # This avoids false "third-party" classification for common stdlib imports.
@@ -458,11 +482,13 @@ class MockDetector:
         "warnings", "wave", "weakref",
         "xml", "xmlrpc",
         "zipfile", "zipimport", "zlib",
-    })
+    }) | sys.stdlib_module_names
 
     def __init__(self, module_info: ModuleInfo):
         self.module_info = module_info
         self.mock_suggestions: dict[str, str] = {}
+        # Top-level package of the analyzed module, computed once per detector
+        self._package_root = module_info.module_name.partition(".")[0]
 
     def detect_mocks(self) -> dict[str, str]:
         """
@@ -487,13 +513,15 @@ class MockDetector:
         return self.mock_suggestions
 
     @classmethod
+    @lru_cache(maxsize=1024)
     def _is_stdlib(cls, module: str) -> bool:
         """Return True if *module* is a Python standard-library package.
 
         Uses the expanded _STDLIB_MODULES whitelist first (fast O(1) lookup),
-        then falls back to importlib.util.find_spec as a heuristic.
+        then falls back to importlib.util.find_spec as a heuristic. Results
+        are cached, so each module hits the import system at most once.
         """
-        top_level = module.split(".")[0]
+        top_level = module.partition(".")[0]
         if top_level in cls._STDLIB_MODULES:
             return True
 
@@ -526,7 +554,7 @@ class MockDetector:
                 return True
 
         # Same-package imports don't need mocking
-        if module.startswith(self.module_info.module_name.split(".")[0]):
+        if module.startswith(self._package_root):
             return False
 
         # Standard library → no mock needed
@@ -1061,6 +1089,42 @@ def {test_name}():
         return f"{ind}assert result is not None"
 
 
+# Parsed modules keyed by (resolved path, content digest). A digest miss means
+# the file changed, so stale entries are simply never hit again. Only the
+# AST-derived fields are reused; the lock guards lookups and eviction.
+_MODULE_INFO_CACHE: dict[tuple[str, bytes], ModuleInfo] = {}
+_MODULE_INFO_CACHE_SIZE = 256
+_MODULE_INFO_CACHE_LOCK = threading.Lock()
+
+
+def _analyze_cached(file_path: str, source: bytes) -> ModuleInfo:
+    """Return CodeAnalyzer results for raw *source*, memoized by content.
+
+    ``file_path`` and ``module_name`` depend on how the file is addressed and
+    on the package layout around it, not on its content, so they are filled
+    in fresh on every call.
+    """
+    digest = hashlib.blake2b(source, digest_size=16).digest()
+    key = (str(Path(file_path).resolve()), digest)
+    # Constructing the analyzer only detects the module path; no parsing yet
+    analyzer = CodeAnalyzer(source, file_path)
+
+    with _MODULE_INFO_CACHE_LOCK:
+        module_info = _MODULE_INFO_CACHE.get(key)
+    if module_info is None:
+        # ast.parse decodes bytes itself, honouring any coding cookie
+        module_info = analyzer.analyze()
+        with _MODULE_INFO_CACHE_LOCK:
+            if len(_MODULE_INFO_CACHE) >= _MODULE_INFO_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del _MODULE_INFO_CACHE[next(iter(_MODULE_INFO_CACHE))]
+            _MODULE_INFO_CACHE[key] = module_info
+
+    return replace(
+        module_info, file_path=file_path, module_name=analyzer.module_name
+    )
+
+
 def generate_tests_for_file(
     file_path: str,
     max_file_bytes: int = 2_000_000,
@@ -1085,12 +1149,8 @@ def generate_tests_for_file(
             f"File too large ({file_size:,} bytes, limit {max_file_bytes:,} bytes)"
         )
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        source_code = f.read()
-
-    # Analyze the code
-    analyzer = CodeAnalyzer(source_code, file_path)
-    module_info = analyzer.analyze()
+    # Analyze the code (reused across calls while the file is unchanged)
+    module_info = _analyze_cached(file_path, path.read_bytes())
 
     # Detect what needs mocking
     mock_detector = MockDetector(module_info)
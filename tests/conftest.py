@@ -2,6 +2,10 @@
 Pytest configuration and fixtures for Dev Brain tests.
 """
 
+import ast
+import copy
+from pathlib import Path
+
 import pytest
 
 
@@ -16,20 +20,19 @@ def pytest_addoption(parser):
 from brain_dev.config import DevBrainConfig
 from brain_dev.server import create_server
 from brain_dev.analyzer import (
-    CoverageGap,
-    MissingBehavior,
-    TestSuggestion,
-    RefactorSuggestion,
-    UXInsight,
     CoverageAnalyzer,
     BehaviorAnalyzer,
     TestGenerator,
     RefactorAnalyzer,
     UXAnalyzer,
+    DocsAnalyzer,
+    SecurityAnalyzer,
 )
 
+GOLDEN_INPUTS_DIR = Path(__file__).parent / "golden" / "inputs"
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def config():
     """Create test configuration."""
     return DevBrainConfig(
@@ -39,43 +42,65 @@ def config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def server(config):
     """Create test server."""
     return create_server(config)
 
 
-@pytest.fixture
-def coverage_analyzer():
-    """Create coverage analyzer."""
+@pytest.fixture(scope="session")
+def _coverage_analyzer_shared():
+    """Session-wide coverage analyzer; copied per test by ``coverage_analyzer``."""
     return CoverageAnalyzer(min_support=0.05)
 
 
 @pytest.fixture
+def coverage_analyzer(_coverage_analyzer_shared):
+    """Create coverage analyzer.
+
+    Tests may tweak ``min_support``, so each test gets a shallow copy of the
+    shared instance instead of the instance itself.
+    """
+    return copy.copy(_coverage_analyzer_shared)
+
+
+@pytest.fixture(scope="session")
 def behavior_analyzer():
     """Create behavior analyzer."""
     return BehaviorAnalyzer()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_generator():
     """Create test generator."""
     return TestGenerator()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def refactor_analyzer():
     """Create refactor analyzer."""
     return RefactorAnalyzer()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ux_analyzer():
     """Create UX analyzer."""
     return UXAnalyzer()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def docs_analyzer():
+    """Create docs analyzer."""
+    return DocsAnalyzer()
+
+
+@pytest.fixture(scope="session")
+def security_analyzer():
+    """Create security analyzer."""
+    return SecurityAnalyzer()
+
+
+@pytest.fixture(scope="session")
 def sample_patterns():
     """Sample behavior patterns for testing."""
     return [
@@ -88,7 +113,18 @@ def sample_patterns():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def observed_priority_samples():
+    """One observed pattern per priority band, as an immutable tuple."""
+    return (
+        {"sequence": ("critical",), "support": 0.35, "occurrence_count": 100},
+        {"sequence": ("high",), "support": 0.25, "occurrence_count": 100},
+        {"sequence": ("medium",), "support": 0.15, "occurrence_count": 100},
+        {"sequence": ("low",), "support": 0.05, "occurrence_count": 100},
+    )
+
+
+@pytest.fixture(scope="session")
 def sample_test_patterns():
     """Sample test coverage patterns."""
     return [
@@ -98,7 +134,7 @@ def sample_test_patterns():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_code_symbols():
     """Sample code symbols for testing."""
     return [
@@ -137,7 +173,7 @@ def sample_code_symbols():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_gap():
     """Sample coverage gap for testing."""
     return {
@@ -149,3 +185,45 @@ def sample_gap():
         "suggested_test": "test_checkout_flow",
         "suggested_file": "tests/test_checkout.py",
     }
+
+
+@pytest.fixture(scope="session")
+def sample_py_file(tmp_path_factory):
+    """Small, valid Python module for smart test generation."""
+    path = tmp_path_factory.mktemp("smartgen") / "hello.py"
+    path.write_text(
+        'def hello(name: str) -> str:\n'
+        '    """Say hello."""\n'
+        '    return f"Hello, {name}"\n'
+    )
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def sample_txt_file(tmp_path_factory):
+    """Non-Python file that smart test generation must reject."""
+    path = tmp_path_factory.mktemp("smartgen") / "notes.txt"
+    path.write_text("This is not Python")
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def broken_py_file(tmp_path_factory):
+    """Python file with a syntax error."""
+    path = tmp_path_factory.mktemp("smartgen") / "broken.py"
+    path.write_text("def broken(:\n    pass")
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def golden_samples():
+    """Golden input sources and their parsed ASTs, keyed by case name.
+
+    Each ``golden/inputs/<case>/sample.py`` is read and parsed once per
+    session and shared by the snapshot tests.
+    """
+    samples = {}
+    for path in sorted(GOLDEN_INPUTS_DIR.glob("*/sample.py")):
+        source = path.read_text(encoding="utf-8")
+        samples[path.parent.name] = (source, ast.parse(source, filename=str(path)))
+    return samples
@@ -0,0 +1,84 @@
+"""
+Tests for BehaviorAnalyzer.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def missing_without_symbols(behavior_analyzer, sample_patterns):
+    """Missing behaviors for sample_patterns when no code symbols exist."""
+    return behavior_analyzer.find_missing_behaviors(
+        sample_patterns, [], min_count=5
+    )
+
+
+# =============================================================================
+# BehaviorAnalyzer Tests
+# =============================================================================
+
+class TestBehaviorAnalyzer:
+    """Tests for BehaviorAnalyzer."""
+
+    def test_create_analyzer(self, behavior_analyzer):
+        """Test creating behavior analyzer."""
+        assert behavior_analyzer is not None
+
+    def test_find_missing_behaviors(
+        self, behavior_analyzer, sample_patterns, sample_code_symbols
+    ):
+        """Test finding behaviors not in code."""
+        missing = behavior_analyzer.find_missing_behaviors(
+            sample_patterns, sample_code_symbols, min_count=5
+        )
+
+        # Should find some missing behaviors
+        # (patterns that don't have corresponding code handlers)
+        assert isinstance(missing, list)
+
+    def test_find_missing_behaviors_respects_min_count(
+        self, behavior_analyzer, sample_patterns, sample_code_symbols
+    ):
+        """Test that min_count filters low-occurrence behaviors."""
+        missing = behavior_analyzer.find_missing_behaviors(
+            sample_patterns, sample_code_symbols, min_count=100
+        )
+
+        # With high min_count, should find fewer missing behaviors
+        for m in missing:
+            assert m.observed_count >= 100
+
+    def test_find_missing_behaviors_empty_patterns(
+        self, behavior_analyzer, sample_code_symbols
+    ):
+        """Test with empty patterns."""
+        missing = behavior_analyzer.find_missing_behaviors(
+            [], sample_code_symbols, min_count=5
+        )
+        assert missing == []
+
+    def test_find_missing_behaviors_no_symbols(self, missing_without_symbols):
+        """Test with no code symbols."""
+        # All patterns should be "missing" if no code exists
+        assert len(missing_without_symbols) > 0
+
+    def test_missing_behavior_has_pattern(self, missing_without_symbols):
+        """Test that missing behaviors include the pattern."""
+        for m in missing_without_symbols:
+            assert isinstance(m.pattern, list)
+            assert len(m.pattern) > 0
+
+    @pytest.mark.parametrize("symbols,expected", [
+        ([], set()),
+        (
+            [{"name": "handle_login"}, {"name": "handle_logout"},
+             {"name": "on_click"}, {"name": "process_payment"}],
+            {"login", "logout", "click", "payment"},
+        ),
+        ([{"name": "calculate_total"}, {"name": "get_data"}], set()),
+        ([{"name": "on_user_click"}], {"user", "click"}),
+        ([{"name": "process_order"}], {"order"}),
+    ], ids=["empty", "handlers", "non-handlers", "on-prefix", "process-prefix"])
+    def test_extract_code_events(self, behavior_analyzer, symbols, expected):
+        """Test event extraction from handler-style symbol names."""
+        assert behavior_analyzer._extract_code_events(symbols) == expected
@@ -0,0 +1,92 @@
+"""
+Tests for CoverageAnalyzer.
+"""
+
+
+# =============================================================================
+# CoverageAnalyzer Tests
+# =============================================================================
+
+class TestCoverageAnalyzer:
+    """Tests for CoverageAnalyzer."""
+
+    def test_create_analyzer(self, coverage_analyzer):
+        """Test creating coverage analyzer."""
+        assert coverage_analyzer.min_support == 0.05
+
+    def test_analyze_gaps_finds_uncovered_patterns(
+        self, coverage_analyzer, sample_patterns, sample_test_patterns
+    ):
+        """Test that analyzer finds patterns not covered by tests."""
+        gaps = coverage_analyzer.analyze_gaps(sample_patterns, sample_test_patterns)
+
+        # Should find gaps for patterns not in test_patterns
+        assert len(gaps) > 0
+
+        # Check that found gaps are actually uncovered
+        gap_patterns = [tuple(g.pattern) for g in gaps]
+        for gap_pattern in gap_patterns:
+            assert list(gap_pattern) not in sample_test_patterns
+
+    def test_analyze_gaps_respects_min_support(self, coverage_analyzer, sample_patterns):
+        """Test that analyzer respects minimum support threshold."""
+        # Pattern with 4% support should be filtered out with 5% threshold
+        coverage_analyzer.min_support = 0.05
+        gaps = coverage_analyzer.analyze_gaps(sample_patterns, [])
+
+        for gap in gaps:
+            assert gap.support >= 0.05
+
+    def test_analyze_gaps_empty_patterns(self, coverage_analyzer):
+        """Test analyzer with empty patterns."""
+        gaps = coverage_analyzer.analyze_gaps([], [])
+        assert gaps == []
+
+    def test_analyze_gaps_all_covered(
+        self, coverage_analyzer, sample_patterns, sample_test_patterns
+    ):
+        """Test when all high-support patterns are covered."""
+        # Cover all patterns
+        all_patterns = [p["sequence"] for p in sample_patterns]
+        gaps = coverage_analyzer.analyze_gaps(sample_patterns, all_patterns)
+
+        # Should have no gaps (or only low-support ones filtered)
+        assert len(gaps) == 0
+
+    def test_analyze_gaps_coverage_ignores_sequence_type(self, coverage_analyzer):
+        """Test that list and tuple sequences match the same coverage entries."""
+        observed = [
+            {"sequence": ["a", "b"], "support": 0.4},
+            {"sequence": ("c", "d"), "support": 0.3},
+            {"sequence": ["e", "f"], "support": 0.2},
+        ]
+        covered = [("a", "b"), ["c", "d"]]
+
+        gaps = coverage_analyzer.analyze_gaps(observed, covered)
+
+        assert [g.pattern for g in gaps] == [["e", "f"]]
+
+    def test_analyze_gaps_assigns_priority(
+        self, coverage_analyzer, sample_patterns
+    ):
+        """Test that gaps are assigned appropriate priorities."""
+        gaps = coverage_analyzer.analyze_gaps(sample_patterns, [])
+
+        for gap in gaps:
+            assert gap.priority in ["critical", "high", "medium", "low"]
+
+            # High support should mean high priority
+            if gap.support >= 0.3:
+                assert gap.priority == "critical"
+            elif gap.support >= 0.2:
+                assert gap.priority == "high"
+
+    def test_analyze_gaps_generates_test_names(
+        self, coverage_analyzer, sample_patterns
+    ):
+        """Test that gaps have suggested test names."""
+        gaps = coverage_analyzer.analyze_gaps(sample_patterns, [])
+
+        for gap in gaps:
+            assert gap.suggested_test_name is not None
+            assert gap.suggested_test_name.startswith("test_")
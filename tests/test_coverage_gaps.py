@@ -12,7 +12,6 @@ import pytest
 from unittest.mock import patch, MagicMock, AsyncMock
 
 from brain_dev.config import DevBrainConfig, load_config
-from brain_dev.analyzer import CoverageAnalyzer, RefactorAnalyzer
 
 
 # =============================================================================
@@ -20,151 +19,104 @@ from brain_dev.analyzer import CoverageAnalyzer, RefactorAnalyzer
 # =============================================================================
 
 class TestCriticalPriorityBranch:
-    """Tests for the critical priority assignment when support >= 0.30."""
-
-    def test_coverage_gap_critical_priority_at_030(self):
-        """Test that support of 0.30 assigns 'critical' priority."""
-        analyzer = CoverageAnalyzer(min_support=0.05)
-
+    """Tests for priority assignment at each support threshold (critical >= 0.30)."""
+
+    @pytest.mark.parametrize("support,expected", [
+        (0.30, "critical"),  # Exactly at threshold
+        (0.45, "critical"),  # Well above threshold
+        (0.29, "high"),      # Just below critical threshold
+        (0.20, "high"),      # Exactly at high threshold
+        (0.19, "medium"),
+        (0.10, "medium"),    # Exactly at medium threshold
+        (0.06, "low"),
+    ])
+    def test_coverage_gap_priority_thresholds(
+        self, coverage_analyzer, support, expected
+    ):
+        """Test that each support band maps to the expected priority."""
         patterns = [
-            {
-                "sequence": ["action_a", "action_b", "action_c"],
-                "support": 0.30,  # Exactly at threshold
-                "occurrence_count": 1000,
-            }
+            {"sequence": ["action_a"], "support": support, "occurrence_count": 1000}
         ]
 
-        gaps = analyzer.analyze_gaps(patterns, [])
+        gaps = coverage_analyzer.analyze_gaps(patterns, [])
 
         assert len(gaps) == 1
-        assert gaps[0].priority == "critical"
-
-    def test_coverage_gap_critical_priority_above_030(self):
-        """Test that support above 0.30 assigns 'critical' priority."""
-        analyzer = CoverageAnalyzer(min_support=0.05)
-
-        patterns = [
-            {
-                "sequence": ["high_freq_action"],
-                "support": 0.45,  # Well above threshold
-                "occurrence_count": 2000,
-            }
-        ]
-
-        gaps = analyzer.analyze_gaps(patterns, [])
-
-        assert len(gaps) == 1
-        assert gaps[0].priority == "critical"
-        assert gaps[0].support == 0.45
-
-    def test_coverage_gap_high_priority_just_below_critical(self):
-        """Test that support at 0.29 assigns 'high' priority (not critical)."""
-        analyzer = CoverageAnalyzer(min_support=0.05)
-
-        patterns = [
-            {
-                "sequence": ["just_below_critical"],
-                "support": 0.29,  # Just below critical threshold
-                "occurrence_count": 900,
-            }
-        ]
-
-        gaps = analyzer.analyze_gaps(patterns, [])
-
-        assert len(gaps) == 1
-        assert gaps[0].priority == "high"  # Not critical
+        assert gaps[0].priority == expected
+        assert gaps[0].support == support
 
 
 # =============================================================================
 # Test: Long Name Refactoring (analyzer.py:480)
 # =============================================================================
 
+_LONG_60 = "a" * 60
+_BORDERLINE_50 = "a" * 50
+_VERY_LONG_100 = "x" * 100
+
+
 class TestLongNameRefactoring:
     """Tests for the long name refactoring suggestion when name > 50 chars."""
 
-    def test_refactor_suggests_rename_for_very_long_name(self):
+    def test_refactor_suggests_rename_for_very_long_name(self, refactor_analyzer):
         """Test that a name over 50 characters triggers a rename suggestion."""
-        analyzer = RefactorAnalyzer()
-
-        # Name with 60 characters
-        long_name = "a" * 60
-
         symbols = [
             {
-                "name": long_name,
+                "name": _LONG_60,
                 "symbol_type": "function",
                 "file_path": "src/handlers.py",
                 "line": 42,
             }
         ]
 
-        suggestions = analyzer.analyze_code(symbols, [], "naming")
+        suggestions = refactor_analyzer.analyze_code(symbols, [], "naming")
 
         # Should find at least one suggestion for the long name
-        long_name_suggestions = [
-            s for s in suggestions
-            if "too long" in s.reason.lower()
-        ]
+        suggestion = next(
+            (s for s in suggestions if "too long" in s.reason.lower()), None
+        )
 
-        assert len(long_name_suggestions) >= 1
-        suggestion = long_name_suggestions[0]
+        assert suggestion is not None
         assert suggestion.suggestion_type == "rename"
         assert "60 chars" in suggestion.reason
         assert suggestion.signal_strength == 0.6
         assert suggestion.confidence == 0.6  # deprecated alias
 
-    def test_refactor_no_rename_for_50_char_name(self):
+    def test_refactor_no_rename_for_50_char_name(self, refactor_analyzer):
         """Test that exactly 50 characters does NOT trigger long name warning."""
-        analyzer = RefactorAnalyzer()
-
-        # Name with exactly 50 characters
-        borderline_name = "a" * 50
-
         symbols = [
             {
-                "name": borderline_name,
+                "name": _BORDERLINE_50,
                 "symbol_type": "function",
                 "file_path": "src/handlers.py",
                 "line": 10,
             }
         ]
 
-        suggestions = analyzer.analyze_code(symbols, [], "naming")
+        suggestions = refactor_analyzer.analyze_code(symbols, [], "naming")
 
         # Should NOT find any "too long" suggestions
-        long_name_suggestions = [
-            s for s in suggestions
-            if "too long" in s.reason.lower()
-        ]
-
-        assert len(long_name_suggestions) == 0
+        assert not any("too long" in s.reason.lower() for s in suggestions)
 
-    def test_refactor_long_name_truncated_in_reason(self):
+    def test_refactor_long_name_truncated_in_reason(self, refactor_analyzer):
         """Test that very long names are truncated in the reason message."""
-        analyzer = RefactorAnalyzer()
-
-        # Name with 100 characters
-        very_long_name = "x" * 100
-
         symbols = [
             {
-                "name": very_long_name,
+                "name": _VERY_LONG_100,
                 "symbol_type": "variable",
                 "file_path": "src/data.py",
                 "line": 5,
             }
         ]
 
-        suggestions = analyzer.analyze_code(symbols, [], "naming")
+        suggestions = refactor_analyzer.analyze_code(symbols, [], "naming")
 
-        long_name_suggestions = [
-            s for s in suggestions
-            if "too long" in s.reason.lower()
-        ]
+        suggestion = next(
+            (s for s in suggestions if "too long" in s.reason.lower()), None
+        )
 
-        assert len(long_name_suggestions) >= 1
+        assert suggestion is not None
         # Reason should truncate the name to 30 chars + "..."
-        assert "..." in long_name_suggestions[0].reason
+        assert "..." in suggestion.reason
 
 
 # =============================================================================
@@ -204,6 +156,16 @@ class TestLoadConfig:
         assert isinstance(config, DevBrainConfig)
         assert config.server_name == "brain-dev"
 
+    def test_load_config_is_memoized_and_immutable(self):
+        """Test that load_config() returns one shared, frozen instance."""
+        from dataclasses import FrozenInstanceError
+
+        config = load_config()
+
+        assert load_config() is config
+        with pytest.raises(FrozenInstanceError):
+            config.max_suggestions = 5
+
 
 # =============================================================================
 # Test: run_server() and main() Entry Points (server.py:458-460, 465, 469)
@@ -212,36 +174,36 @@ class TestLoadConfig:
 class TestServerEntryPoints:
     """Tests for the server entry point functions."""
 
-    @pytest.mark.asyncio
-    async def test_run_server_creates_and_runs_server(self):
+    @pytest.fixture
+    def mock_server_env(self, monkeypatch):
+        """Patch stdio_server and create_server; return (mock_create, mock_server)."""
+        # Make stdio_server an async context manager yielding mock streams
+        mock_context = MagicMock()
+        mock_context.__aenter__ = AsyncMock(return_value=(MagicMock(), MagicMock()))
+        mock_context.__aexit__ = AsyncMock(return_value=None)
+        monkeypatch.setattr(
+            "brain_dev.server.stdio_server", MagicMock(return_value=mock_context)
+        )
+
+        mock_server = MagicMock()
+        mock_server.run = AsyncMock()
+        mock_server.create_initialization_options = MagicMock(return_value={})
+        mock_create = MagicMock(return_value=mock_server)
+        monkeypatch.setattr("brain_dev.server.create_server", mock_create)
+
+        return mock_create, mock_server
+
+    async def test_run_server_creates_and_runs_server(self, mock_server_env):
         """Test that run_server() creates a server and attempts to run it."""
         from brain_dev.server import run_server
 
-        # Mock the stdio_server context manager and server.run
-        mock_read_stream = MagicMock()
-        mock_write_stream = MagicMock()
+        mock_create, mock_server = mock_server_env
 
-        with patch('brain_dev.server.stdio_server') as mock_stdio:
-            # Make stdio_server an async context manager
-            mock_context = MagicMock()
-            mock_context.__aenter__ = AsyncMock(
-                return_value=(mock_read_stream, mock_write_stream)
-            )
-            mock_context.__aexit__ = AsyncMock(return_value=None)
-            mock_stdio.return_value = mock_context
+        await run_server()
 
-            with patch('brain_dev.server.create_server') as mock_create:
-                mock_server = MagicMock()
-                mock_server.run = AsyncMock()
-                mock_server.create_initialization_options = MagicMock(return_value={})
-                mock_create.return_value = mock_server
-
-                # Run the async function
-                await run_server()
-
-                # Verify server was created and run was called
-                mock_create.assert_called_once()
-                mock_server.run.assert_called_once()
+        # Verify server was created and run was called
+        mock_create.assert_called_once()
+        mock_server.run.assert_called_once()
 
     def test_main_calls_asyncio_run(self):
         """Test that main() uses asyncio.run to execute run_server."""
@@ -272,42 +234,32 @@ class TestServerEntryPoints:
 class TestEdgeCases:
     """Additional edge case tests for complete coverage."""
 
-    def test_coverage_analyzer_with_multiple_priorities(self):
+    def test_coverage_analyzer_with_multiple_priorities(
+        self, coverage_analyzer, observed_priority_samples
+    ):
         """Test that patterns with different supports get correct priorities."""
-        analyzer = CoverageAnalyzer(min_support=0.01)
-
-        patterns = [
-            {"sequence": ["critical"], "support": 0.35, "occurrence_count": 100},
-            {"sequence": ["high"], "support": 0.25, "occurrence_count": 100},
-            {"sequence": ["medium"], "support": 0.15, "occurrence_count": 100},
-            {"sequence": ["low"], "support": 0.05, "occurrence_count": 100},
-        ]
-
-        gaps = analyzer.analyze_gaps(patterns, [])
+        gaps = coverage_analyzer.analyze_gaps(list(observed_priority_samples), [])
 
         # Map patterns to priorities
         priorities = {tuple(g.pattern): g.priority for g in gaps}
 
-        assert priorities[("critical",)] == "critical"
-        assert priorities[("high",)] == "high"
-        assert priorities[("medium",)] == "medium"
-        assert priorities[("low",)] == "low"
+        assert priorities == {
+            ("critical",): "critical",
+            ("high",): "high",
+            ("medium",): "medium",
+            ("low",): "low",
+        }
 
-    def test_refactor_analyzer_combined_naming_issues(self):
+    def test_refactor_analyzer_combined_naming_issues(self, refactor_analyzer):
         """Test analyzer handles both single-letter and long names."""
-        analyzer = RefactorAnalyzer()
-
         symbols = [
             {"name": "x", "symbol_type": "variable", "file_path": "a.py", "line": 1},
-            {"name": "a" * 60, "symbol_type": "function", "file_path": "b.py", "line": 2},
+            {"name": _LONG_60, "symbol_type": "function", "file_path": "b.py", "line": 2},
             {"name": "normal_name", "symbol_type": "function", "file_path": "c.py", "line": 3},
         ]
 
-        suggestions = analyzer.analyze_code(symbols, [], "naming")
+        suggestions = refactor_analyzer.analyze_code(symbols, [], "naming")
 
         # Should find suggestions for both single-letter and long name
-        single_letter = [s for s in suggestions if "single-letter" in s.reason.lower()]
-        long_name = [s for s in suggestions if "too long" in s.reason.lower()]
-
-        assert len(single_letter) >= 1
-        assert len(long_name) >= 1
+        assert any("single-letter" in s.reason.lower() for s in suggestions)
+        assert any("too long" in s.reason.lower() for s in suggestions)
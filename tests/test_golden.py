@@ -1,17 +1,23 @@
 """Golden-file (snapshot) tests for analyzer behavior.
 
 Each test case:
-1. Reads a small Python sample from tests/golden/inputs/<case>/sample.py
+1. Takes a small Python sample from tests/golden/inputs/<case>/sample.py
+   (read and parsed once per session by the ``golden_samples`` fixture)
 2. Runs the appropriate analyzer
 3. Normalizes output (deterministic IDs, sorted, no machine-specific paths)
 4. Compares against tests/golden/expected/<case>.json
 
 To update snapshots after an intentional change:
     pytest tests/test_golden.py --update-golden
+
+PYTEST_DONT_REWRITE: the mismatch check raises its own diff message, so
+pytest's assertion rewriting adds nothing for this module.
 """
 
 from __future__ import annotations
 
+import ast
+import functools
 import json
 import re
 from pathlib import Path
@@ -26,31 +32,39 @@ from brain_dev.analyzer import (
 )
 
 GOLDEN_DIR = Path(__file__).parent / "golden"
-INPUTS_DIR = GOLDEN_DIR / "inputs"
 EXPECTED_DIR = GOLDEN_DIR / "expected"
 
 
 # ── Normalization helpers ─────────────────────────────────────────────
 
-_ID_PATTERN = re.compile(r"^(sec_|doc_|complex_|ux_|dup_|name_).*$")
+_ID_PATTERN = re.compile(r"^(sec_|doc_|complex_|ux_|dup_|name_)")
 
 
 def _normalize_id(value: str) -> str:
     """Replace nondeterministic hash suffixes in IDs with a placeholder."""
     # e.g. "sec_a1b2c3d4" → "sec_<hash>"
-    for prefix in ("sec_", "doc_", "complex_", "dup_", "name_", "ux_"):
-        if value.startswith(prefix):
-            return f"{prefix}<hash>"
-    return value
+    m = _ID_PATTERN.match(value)
+    return f"{m.group(1)}<hash>" if m else value
+
+
+def _key_plan(item: dict[str, Any]) -> tuple[list[str], frozenset[str]]:
+    """Work out key order and ID keys for one output schema."""
+    id_keys = frozenset(k for k in item if k.endswith("_id"))
+    return sorted(item), id_keys
 
 
-def _normalize_item(item: dict[str, Any]) -> dict[str, Any]:
+def _normalize_item(
+    item: dict[str, Any],
+    sorted_keys: list[str],
+    id_keys: frozenset[str],
+) -> dict[str, Any]:
     """Normalize a single output dict for stable comparison."""
     out = {}
-    for key, value in sorted(item.items()):
-        if key.endswith("_id") and isinstance(value, str):
+    for key in sorted_keys:
+        value = item[key]
+        if key in id_keys and type(value) is str:
             out[key] = _normalize_id(value)
-        elif isinstance(value, float):
+        elif type(value) is float:
             out[key] = round(value, 4)
         else:
             out[key] = value
@@ -68,32 +82,33 @@ def _sort_key(item: dict[str, Any]) -> tuple:
 
 def _normalize_output(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Normalize and sort a list of analyzer output dicts."""
-    normalized = [_normalize_item(d) for d in items]
+    if not items:
+        return []
+    # Analyzer outputs come from one dataclass, so all items share a schema
+    first_keys = items[0].keys()
+    plan = _key_plan(items[0])
+    normalized = [
+        _normalize_item(d, *(plan if d.keys() == first_keys else _key_plan(d)))
+        for d in items
+    ]
     return sorted(normalized, key=_sort_key)
 
 
-# ── Helpers for reading inputs ────────────────────────────────────────
-
-
-def _read_sample(case_name: str) -> str:
-    """Read the sample.py input for a golden test case."""
-    path = INPUTS_DIR / case_name / "sample.py"
-    return path.read_text(encoding="utf-8")
-
+# ── Helpers for building symbols ──────────────────────────────────────
 
-def _build_symbols_from_source(source: str, file_path: str) -> list[dict]:
-    """Parse source into per-function symbol dicts for analyzers that need them."""
-    import ast
 
-    tree = ast.parse(source)
+def _build_symbols_from_source(
+    source: str, tree: ast.Module, file_path: str,
+) -> list[dict]:
+    """Turn a parsed sample into per-function symbol dicts for analyzers that need them."""
+    lines = source.splitlines()
     symbols = []
     for node in ast.walk(tree):
         if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
             # Extract the source lines for this function
             start = node.lineno - 1
             end = node.end_lineno if node.end_lineno else start + 1
-            lines = source.splitlines()[start:end]
-            func_source = "\n".join(lines)
+            func_source = "\n".join(lines[start:end])
             symbols.append({
                 "name": node.name,
                 "file_path": file_path,
@@ -112,11 +127,8 @@ def _build_symbols_from_source(source: str, file_path: str) -> list[dict]:
     return symbols
 
 
-def _build_doc_symbols(source: str, file_path: str) -> list[dict]:
+def _build_doc_symbols(tree: ast.Module, file_path: str) -> list[dict]:
     """Build symbol dicts specifically for DocsAnalyzer."""
-    import ast
-
-    tree = ast.parse(source)
     symbols = []
     for node in ast.walk(tree):
         if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
@@ -141,8 +153,12 @@ def _build_doc_symbols(source: str, file_path: str) -> list[dict]:
 # ── Snapshot comparison ───────────────────────────────────────────────
 
 
+@functools.lru_cache(maxsize=None)
 def _load_expected(case_name: str) -> list[dict[str, Any]] | None:
-    """Load expected JSON, or None if it doesn't exist yet."""
+    """Load expected JSON, or None if it doesn't exist yet.
+
+    Cached per case; callers must treat the result as read-only.
+    """
     path = EXPECTED_DIR / f"{case_name}.json"
     if not path.exists():
         return None
@@ -157,6 +173,7 @@ def _save_expected(case_name: str, data: list[dict[str, Any]]) -> None:
         json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False) + "\n",
         encoding="utf-8",
     )
+    _load_expected.cache_clear()
 
 
 def _assert_golden(
@@ -178,53 +195,69 @@ def _assert_golden(
         pytest.skip(f"Created initial golden file: {case_name}.json (re-run to verify)")
         return
 
-    assert normalized == expected, (
-        f"Golden file mismatch for {case_name}.\n"
-        f"If the change is intentional, run:\n"
-        f"  pytest tests/test_golden.py --update-golden\n\n"
-        f"Actual ({len(normalized)} items):\n{json.dumps(normalized, indent=2)}\n\n"
-        f"Expected ({len(expected)} items):\n{json.dumps(expected, indent=2)}"
-    )
+    if normalized != expected:
+        # Only render the JSON diff on failure
+        raise AssertionError(
+            f"Golden file mismatch for {case_name}.\n"
+            f"If the change is intentional, run:\n"
+            f"  pytest tests/test_golden.py --update-golden\n\n"
+            f"Actual ({len(normalized)} items):\n{json.dumps(normalized, indent=2)}\n\n"
+            f"Expected ({len(expected)} items):\n{json.dumps(expected, indent=2)}"
+        )
 
 
 # ── Test cases ────────────────────────────────────────────────────────
 
 
-def test_golden_security_injection_patterns(request):
-    """Snapshot: SecurityAnalyzer on known injection patterns."""
-    source = _read_sample("security_injection_patterns")
-    symbols = _build_symbols_from_source(source, "sample.py")
-
-    analyzer = SecurityAnalyzer()
-    issues = analyzer.analyze_security(symbols, severity_threshold="low")
-
-    raw = [issue.to_dict() for issue in issues]
-    _assert_golden("security_injection_patterns", raw, request)
-
-
-def test_golden_doc_completeness(request):
-    """Snapshot: DocsAnalyzer on mixed documentation quality."""
-    source = _read_sample("doc_completeness")
-    symbols = _build_doc_symbols(source, "sample.py")
-
-    analyzer = DocsAnalyzer()
-    suggestions = analyzer.analyze_docs(symbols, doc_style="google")
-
-    raw = [s.to_dict() for s in suggestions]
-    _assert_golden("doc_completeness", raw, request)
-
-
-def test_golden_complexity_scoring(request):
-    """Snapshot: RefactorAnalyzer complexity on various nesting depths."""
-    source = _read_sample("complexity_scoring")
-    symbols = _build_symbols_from_source(source, "sample.py")
-
-    analyzer = RefactorAnalyzer()
-    suggestions = analyzer.analyze_code(
-        symbols=symbols,
-        patterns=[],
-        analysis_type="complexity",
-    )
-
-    raw = [s.to_dict() for s in suggestions]
-    _assert_golden("complexity_scoring", raw, request)
+def _symbols_from_source(source: str, tree: ast.Module) -> list[dict]:
+    return _build_symbols_from_source(source, tree, "sample.py")
+
+
+def _doc_symbols(source: str, tree: ast.Module) -> list[dict]:
+    return _build_doc_symbols(tree, "sample.py")
+
+
+@pytest.mark.parametrize(
+    "case_name,analyzer_factory,symbol_builder,run",
+    [
+        pytest.param(
+            "security_injection_patterns",
+            SecurityAnalyzer,
+            _symbols_from_source,
+            lambda a, symbols: a.analyze_security(symbols, severity_threshold="low"),
+            id="security_injection_patterns",
+        ),
+        pytest.param(
+            "doc_completeness",
+            DocsAnalyzer,
+            _doc_symbols,
+            lambda a, symbols: a.analyze_docs(symbols, doc_style="google"),
+            id="doc_completeness",
+        ),
+        pytest.param(
+            "complexity_scoring",
+            RefactorAnalyzer,
+            _symbols_from_source,
+            lambda a, symbols: a.analyze_code(
+                symbols=symbols, patterns=[], analysis_type="complexity",
+            ),
+            id="complexity_scoring",
+        ),
+    ],
+)
+def test_golden(
+    request, golden_samples, case_name, analyzer_factory, symbol_builder, run,
+):
+    """Snapshot: run one analyzer over its sample and compare to the golden file.
+
+    Cases: SecurityAnalyzer on known injection patterns, DocsAnalyzer on
+    mixed documentation quality, RefactorAnalyzer complexity on various
+    nesting depths.
+    """
+    source, tree = golden_samples[case_name]
+    symbols = symbol_builder(source, tree)
+
+    results = run(analyzer_factory(), symbols)
+
+    raw = [r.to_dict() for r in results]
+    _assert_golden(case_name, raw, request)
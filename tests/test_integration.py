@@ -8,12 +8,9 @@ all interactions between servers.
 
 import json
 import pytest
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
-from mcp.types import (
-    ListToolsRequest,
-    CallToolRequest,
-)
+from mcp.types import CallToolRequest
 
 from brain_dev.config import DevBrainConfig
 from brain_dev.server import create_server
@@ -26,10 +23,7 @@ from brain_dev.server import create_server
 async def call_tool(server, name: str, arguments: dict) -> dict:
     """Call a tool and return parsed JSON result."""
     handler = server.request_handlers[CallToolRequest]
-    request = MagicMock()
-    request.params = MagicMock()
-    request.params.name = name
-    request.params.arguments = arguments
+    request = SimpleNamespace(params=SimpleNamespace(name=name, arguments=arguments))
     result = await handler(request)
     return json.loads(result.root.content[0].text)
 
@@ -38,7 +32,7 @@ async def call_tool(server, name: str, arguments: dict) -> dict:
 # Fixtures Simulating Context Engine Data
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def context_patterns_data():
     """
     Simulates data from Context Engine's context_patterns tool.
@@ -85,7 +79,7 @@ def context_patterns_data():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def context_code_symbols():
     """
     Simulates data from Context Engine's context_search_code tool.
@@ -139,12 +133,14 @@ def context_code_symbols():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def existing_test_patterns():
     """
     Simulates test patterns extracted from existing test files.
 
     These would come from parsing test files with the Context Engine.
+    Kept as JSON-shaped lists because the tool schema requires arrays;
+    built once per session and never mutated by the tools.
     """
     return [
         # Login flow is tested
@@ -156,7 +152,7 @@ def existing_test_patterns():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def brain_dev_server():
     """Create Dev Brain server for testing."""
     return create_server(DevBrainConfig(
@@ -173,7 +169,6 @@ def brain_dev_server():
 class TestCoverageAnalysisWorkflow:
     """Tests the coverage analysis workflow using Context Engine data."""
 
-    @pytest.mark.asyncio
     async def test_identify_coverage_gaps_from_patterns(
         self, brain_dev_server, context_patterns_data, existing_test_patterns
     ):
@@ -201,18 +196,17 @@ class TestCoverageAnalysisWorkflow:
         # The checkout flow should be flagged (high support, not fully tested)
         checkout_gaps = [
             g for g in gaps
-            if "checkout" in str(g["pattern"]).lower()
+            if any("checkout" in token.lower() for token in g["pattern"])
         ]
         assert len(checkout_gaps) > 0
 
         # Error handling flow should be flagged
         error_gaps = [
             g for g in gaps
-            if "error" in str(g["pattern"]).lower()
+            if any("error" in token.lower() for token in g["pattern"])
         ]
         assert len(error_gaps) > 0
 
-    @pytest.mark.asyncio
     async def test_generate_tests_for_gaps(
         self, brain_dev_server, context_patterns_data, existing_test_patterns
     ):
@@ -254,7 +248,6 @@ class TestCoverageAnalysisWorkflow:
 class TestBehaviorAnalysisWorkflow:
     """Tests the behavior analysis workflow using Context Engine data."""
 
-    @pytest.mark.asyncio
     async def test_find_unhandled_user_behaviors(
         self, brain_dev_server, context_patterns_data, context_code_symbols
     ):
@@ -290,7 +283,6 @@ class TestBehaviorAnalysisWorkflow:
 class TestRefactoringWorkflow:
     """Tests the refactoring workflow using Context Engine data."""
 
-    @pytest.mark.asyncio
     async def test_suggest_refactoring_from_code_symbols(
         self, brain_dev_server, context_code_symbols, context_patterns_data
     ):
@@ -327,7 +319,6 @@ class TestRefactoringWorkflow:
 class TestUXInsightsWorkflow:
     """Tests the UX insights workflow using Context Engine data."""
 
-    @pytest.mark.asyncio
     async def test_analyze_user_flow_dropoff(
         self, brain_dev_server, context_patterns_data
     ):
@@ -356,7 +347,6 @@ class TestUXInsightsWorkflow:
             assert "signal_strength" in insight
             assert "confidence" in insight  # deprecated alias still emitted
 
-    @pytest.mark.asyncio
     async def test_analyze_error_flows(
         self, brain_dev_server, context_patterns_data
     ):
@@ -378,7 +368,7 @@ class TestUXInsightsWorkflow:
         # Should identify the payment error flow
         error_insights = [
             i for i in result["insights"]
-            if "error" in i.get("finding", "").lower() or "payment" in i.get("finding", "").lower()
+            if "error" in (finding := i.get("finding", "").lower()) or "payment" in finding
         ]
         # May or may not find insights depending on the analyzer logic
         assert isinstance(error_insights, list)
@@ -391,7 +381,6 @@ class TestUXInsightsWorkflow:
 class TestFullAnalysisPipeline:
     """Tests the complete analysis pipeline from Context Engine data."""
 
-    @pytest.mark.asyncio
     async def test_comprehensive_codebase_analysis(
         self,
         brain_dev_server,
@@ -477,7 +466,6 @@ class TestFullAnalysisPipeline:
 class TestServerHealthCheck:
     """Tests server health and stats."""
 
-    @pytest.mark.asyncio
     async def test_server_stats(self, brain_dev_server):
         """Test that server reports stats correctly."""
         result = await call_tool(brain_dev_server, "brain_stats", {})
@@ -0,0 +1,266 @@
+"""
+Tests for Dev Brain analyzer result records.
+"""
+
+from dataclasses import FrozenInstanceError
+
+import pytest
+from brain_dev.analyzer import (
+    CoverageGap,
+    MissingBehavior,
+    TestSuggestion,
+    RefactorSuggestion,
+    UXInsight,
+    DocSuggestion,
+    SecurityIssue,
+)
+
+
+# =============================================================================
+# CoverageGap Tests
+# =============================================================================
+
+class TestCoverageGap:
+    """Tests for CoverageGap dataclass."""
+
+    def test_create_coverage_gap(self):
+        """Test creating a coverage gap."""
+        gap = CoverageGap(
+            gap_id="gap_001",
+            pattern=["login", "checkout"],
+            support=0.15,
+            priority="high",
+            suggested_test_name="test_login_checkout_flow",
+            suggested_test_file="tests/test_flow.py",
+            description="Login to checkout flow not tested",
+        )
+
+        assert gap.gap_id == "gap_001"
+        assert gap.pattern == ["login", "checkout"]
+        assert gap.support == 0.15
+        assert gap.priority == "high"
+
+    def test_coverage_gap_to_dict(self):
+        """Test converting coverage gap to dict."""
+        gap = CoverageGap(
+            gap_id="gap_002",
+            pattern=["search", "filter"],
+            support=0.10,
+            priority="medium",
+            suggested_test_name="test_search_filter",
+            suggested_test_file="tests/test_search.py",
+            description="Search filter flow",
+        )
+
+        d = gap.to_dict()
+        assert d["gap_id"] == "gap_002"
+        assert d["pattern"] == ["search", "filter"]
+        assert d["support"] == 0.10
+        assert d["priority"] == "medium"
+        assert "suggested_test" in d
+        assert d["suggested_test"] == "test_search_filter"
+
+
+# =============================================================================
+# MissingBehavior Tests
+# =============================================================================
+
+class TestMissingBehavior:
+    """Tests for MissingBehavior dataclass."""
+
+    def test_create_missing_behavior(self):
+        """Test creating a missing behavior."""
+        behavior = MissingBehavior(
+            behavior_id="beh_001",
+            pattern=["bulk_delete", "confirm"],
+            observed_count=25,
+            description="Users frequently attempt bulk deletion",
+            suggested_action="handle_bulk_delete",
+            affected_files=["handlers.py"],
+        )
+
+        assert behavior.behavior_id == "beh_001"
+        assert behavior.pattern == ["bulk_delete", "confirm"]
+        assert behavior.observed_count == 25
+
+    def test_missing_behavior_to_dict(self):
+        """Test converting missing behavior to dict."""
+        behavior = MissingBehavior(
+            behavior_id="beh_002",
+            pattern=["export_data"],
+            observed_count=15,
+            description="Export behavior",
+            suggested_action="Add export handler",
+        )
+
+        d = behavior.to_dict()
+        assert d["behavior_id"] == "beh_002"
+        assert d["pattern"] == ["export_data"]
+        assert d["observed_count"] == 15
+
+
+# =============================================================================
+# TestSuggestion Tests
+# =============================================================================
+
+class TestTestSuggestionModel:
+    """Tests for TestSuggestion dataclass."""
+
+    def test_create_test_suggestion(self):
+        """Test creating a test suggestion."""
+        suggestion = TestSuggestion(
+            test_name="test_user_login_flow",
+            test_file="tests/test_auth.py",
+            test_code="def test_user_login_flow():\n    pass",
+            covers_pattern=["login", "logout"],
+            framework="pytest",
+            style="unit",
+        )
+
+        assert suggestion.test_name == "test_user_login_flow"
+        assert suggestion.framework == "pytest"
+        assert suggestion.style == "unit"
+
+    def test_test_suggestion_to_dict(self):
+        """Test converting test suggestion to dict."""
+        suggestion = TestSuggestion(
+            test_name="test_search",
+            test_file="tests/test_search.py",
+            test_code="def test_search(): pass",
+            covers_pattern=["search"],
+            framework="pytest",
+            style="integration",
+        )
+
+        d = suggestion.to_dict()
+        assert d["test_name"] == "test_search"
+        assert d["framework"] == "pytest"
+        assert d["style"] == "integration"
+        assert "test_code" in d
+
+
+# =============================================================================
+# RefactorSuggestion Tests
+# =============================================================================
+
+class TestRefactorSuggestion:
+    """Tests for RefactorSuggestion dataclass."""
+
+    def test_create_refactor_suggestion(self):
+        """Test creating a refactor suggestion."""
+        suggestion = RefactorSuggestion(
+            suggestion_id="ref_001",
+            suggestion_type="reduce_complexity",
+            location="processor.py:10",
+            reason="Function has high cyclomatic complexity",
+            signal_strength=0.85,
+        )
+
+        assert suggestion.suggestion_id == "ref_001"
+        assert suggestion.suggestion_type == "reduce_complexity"
+        assert suggestion.signal_strength == 0.85
+        assert suggestion.confidence == 0.85  # deprecated alias
+
+    def test_refactor_suggestion_to_dict(self):
+        """Test converting refactor suggestion to dict."""
+        suggestion = RefactorSuggestion(
+            suggestion_id="ref_002",
+            suggestion_type="extract_common",
+            location="validators.py:20",
+            reason="Similar code in multiple places",
+            signal_strength=0.72,
+        )
+
+        d = suggestion.to_dict()
+        assert d["suggestion_id"] == "ref_002"
+        assert d["type"] == "extract_common"
+        assert d["signal_strength"] == 0.72
+        assert d["confidence"] == 0.72  # deprecated alias
+
+
+# =============================================================================
+# UXInsight Tests
+# =============================================================================
+
+class TestUXInsight:
+    """Tests for UXInsight dataclass."""
+
+    def test_create_ux_insight(self):
+        """Test creating a UX insight."""
+        insight = UXInsight(
+            insight_id="ux_001",
+            finding="35% of users abandon at payment step",
+            supporting_patterns=5,
+            signal_strength=0.78,
+            suggestion="Simplify payment form",
+            metric="dropoff",
+        )
+
+        assert insight.insight_id == "ux_001"
+        assert insight.metric == "dropoff"
+        assert insight.signal_strength == 0.78
+        assert insight.confidence == 0.78  # deprecated alias
+
+    def test_ux_insight_to_dict(self):
+        """Test converting UX insight to dict."""
+        insight = UXInsight(
+            insight_id="ux_002",
+            finding="12% error rate on form submission",
+            supporting_patterns=3,
+            signal_strength=0.65,
+            suggestion="Add validation",
+            metric="error_rate",
+        )
+
+        d = insight.to_dict()
+        assert d["insight_id"] == "ux_002"
+        assert d["metric"] == "error_rate"
+        assert d["signal_strength"] == 0.65
+        assert d["confidence"] == 0.65  # deprecated alias
+
+
+# =============================================================================
+# Shared record layout
+# =============================================================================
+
+@pytest.mark.parametrize("record_cls", [
+    CoverageGap,
+    MissingBehavior,
+    TestSuggestion,
+    RefactorSuggestion,
+    UXInsight,
+    DocSuggestion,
+    SecurityIssue,
+])
+def test_records_are_slotted(record_cls):
+    """Regression: result records use __slots__ and carry no per-instance __dict__."""
+    assert "__slots__" in vars(record_cls)
+    assert "__dict__" not in dir(record_cls)
+
+
+@pytest.mark.parametrize("record", [
+    DocSuggestion(
+        suggestion_id="doc_1",
+        symbol_name="f",
+        symbol_type="function",
+        location="a.py:1",
+        doc_type="missing",
+        suggested_doc='"""Document f."""',
+        signal_strength=0.9,
+    ),
+    SecurityIssue(
+        issue_id="sec_1",
+        severity="high",
+        category="xss",
+        location="a.py:1",
+        description="Potential xss vulnerability detected",
+        recommendation="Escape output",
+        signal_strength=0.7,
+        cwe_id="CWE-79",
+    ),
+], ids=["DocSuggestion", "SecurityIssue"])
+def test_records_are_frozen(record):
+    """Regression: batch-built records are immutable and hashable."""
+    with pytest.raises(FrozenInstanceError):
+        record.signal_strength = 0.0
+    assert hash(record) == hash(record)
@@ -4,9 +4,7 @@ Tests for docs_generate, security_audit, and smart_tests_generate tools.
 
 import pytest
 import json
-import tempfile
-import os
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
 
 from mcp.types import TextContent, CallToolRequest
 
@@ -17,30 +15,35 @@ from brain_dev.server import create_server
 async def call_tool(server, name: str, arguments: dict) -> list[TextContent]:
     """Call a tool on the server."""
     handler = server.request_handlers[CallToolRequest]
-    request = MagicMock()
-    request.params = MagicMock()
-    request.params.name = name
-    request.params.arguments = arguments
+    request = SimpleNamespace(params=SimpleNamespace(name=name, arguments=arguments))
     result = await handler(request)
     return result.root.content
 
 
+def call_tool_raw(server, name: str, arguments: dict) -> dict:
+    """Call a tool's handler directly and return its payload dict.
+
+    Skips MCP schema validation and the JSON round trip; each tool keeps one
+    test that goes through ``call_tool`` to cover the wire format.
+    """
+    return server._tool_impls[name](arguments)
+
+
 class TestDocsGenerateTool:
     """Tests for docs_generate tool."""
 
-    @pytest.fixture
-    def server(self):
-        return create_server()
-
-    @pytest.mark.asyncio
-    async def test_docs_generate_finds_missing(self, server):
-        """Test that docs_generate finds missing docstrings."""
+    @pytest.mark.parametrize("name,docstring,expected_doc_type", [
+        pytest.param("my_function", "", "missing", id="missing"),
+        pytest.param("short_doc", "Too short.", "incomplete", id="incomplete"),
+    ])
+    async def test_docs_generate_finds(self, server, name, docstring, expected_doc_type):
+        """Test that docs_generate flags missing and incomplete docstrings."""
         result = await call_tool(server, "docs_generate", {
             "symbols": [
                 {
-                    "name": "my_function",
+                    "name": name,
                     "symbol_type": "function",
-                    "docstring": "",
+                    "docstring": docstring,
                     "file_path": "test.py",
                     "line": 10,
                 }
@@ -52,43 +55,21 @@ class TestDocsGenerateTool:
         data = json.loads(result[0].text)
         assert data["total_found"] == 1
         assert len(data["suggestions"]) == 1
-        assert data["suggestions"][0]["doc_type"] == "missing"
+        assert data["suggestions"][0]["doc_type"] == expected_doc_type
         assert data["doc_style"] == "google"
 
-    @pytest.mark.asyncio
-    async def test_docs_generate_empty_symbols(self, server):
+    def test_docs_generate_empty_symbols(self, server):
         """Test docs_generate with empty symbols."""
-        result = await call_tool(server, "docs_generate", {
+        data = call_tool_raw(server, "docs_generate", {
             "symbols": [],
         })
 
-        data = json.loads(result[0].text)
         assert data["total_found"] == 0
         assert data["suggestions"] == []
 
-    @pytest.mark.asyncio
-    async def test_docs_generate_incomplete(self, server):
-        """Test docs_generate finds incomplete docs."""
-        result = await call_tool(server, "docs_generate", {
-            "symbols": [
-                {
-                    "name": "short_doc",
-                    "symbol_type": "function",
-                    "docstring": "Too short.",
-                    "file_path": "test.py",
-                    "line": 1,
-                }
-            ],
-        })
-
-        data = json.loads(result[0].text)
-        assert data["total_found"] == 1
-        assert data["suggestions"][0]["doc_type"] == "incomplete"
-
-    @pytest.mark.asyncio
-    async def test_docs_generate_default_style(self, server):
+    def test_docs_generate_default_style(self, server):
         """Test docs_generate uses default style."""
-        result = await call_tool(server, "docs_generate", {
+        data = call_tool_raw(server, "docs_generate", {
             "symbols": [
                 {
                     "name": "func",
@@ -101,18 +82,12 @@ class TestDocsGenerateTool:
             # No doc_style specified, should default to google
         })
 
-        data = json.loads(result[0].text)
         assert data["doc_style"] == "google"
 
 
 class TestSecurityAuditTool:
     """Tests for security_audit tool."""
 
-    @pytest.fixture
-    def server(self):
-        return create_server()
-
-    @pytest.mark.asyncio
     async def test_security_audit_finds_sql_injection(self, server):
         """Test that security_audit finds SQL injection."""
         result = await call_tool(server, "security_audit", {
@@ -130,10 +105,9 @@ class TestSecurityAuditTool:
         assert data["total_found"] >= 1
         assert any(i["category"] == "sql_injection" for i in data["issues"])
 
-    @pytest.mark.asyncio
-    async def test_security_audit_with_threshold(self, server):
+    def test_security_audit_with_threshold(self, server):
         """Test security_audit with severity threshold."""
-        result = await call_tool(server, "security_audit", {
+        data = call_tool_raw(server, "security_audit", {
             "symbols": [
                 {
                     "name": "config",
@@ -145,24 +119,20 @@ class TestSecurityAuditTool:
             "severity_threshold": "high",
         })
 
-        data = json.loads(result[0].text)
         assert data["severity_threshold"] == "high"
 
-    @pytest.mark.asyncio
-    async def test_security_audit_empty_symbols(self, server):
+    def test_security_audit_empty_symbols(self, server):
         """Test security_audit with empty symbols."""
-        result = await call_tool(server, "security_audit", {
+        data = call_tool_raw(server, "security_audit", {
             "symbols": [],
         })
 
-        data = json.loads(result[0].text)
         assert data["total_found"] == 0
         assert data["issues"] == []
 
-    @pytest.mark.asyncio
-    async def test_security_audit_multiple_issues(self, server):
+    def test_security_audit_multiple_issues(self, server):
         """Test security_audit with multiple vulnerability types."""
-        result = await call_tool(server, "security_audit", {
+        data = call_tool_raw(server, "security_audit", {
             "symbols": [
                 {
                     "name": "bad_code",
@@ -175,26 +145,22 @@ cursor.execute(f"SELECT * FROM t WHERE x = {y}")''',
             ],
         })
 
-        data = json.loads(result[0].text)
         assert data["total_found"] >= 2
         categories = {i["category"] for i in data["issues"]}
         assert len(categories) >= 2
 
-    @pytest.mark.asyncio
-    async def test_security_audit_default_threshold(self, server):
+    def test_security_audit_default_threshold(self, server):
         """Test security_audit uses default threshold."""
-        result = await call_tool(server, "security_audit", {
+        data = call_tool_raw(server, "security_audit", {
             "symbols": [],
             # No severity_threshold, should default to "low"
         })
 
-        data = json.loads(result[0].text)
         assert data["severity_threshold"] == "low"
 
-    @pytest.mark.asyncio
-    async def test_security_audit_severity_counts(self, server):
+    def test_security_audit_severity_counts(self, server):
         """Test security_audit includes severity counts."""
-        result = await call_tool(server, "security_audit", {
+        data = call_tool_raw(server, "security_audit", {
             "symbols": [
                 {
                     "name": "bad",
@@ -205,7 +171,6 @@ cursor.execute(f"SELECT * FROM t WHERE x = {y}")''',
             ],
         })
 
-        data = json.loads(result[0].text)
         assert "severity_counts" in data
         assert isinstance(data["severity_counts"], dict)
 
@@ -213,90 +178,50 @@ cursor.execute(f"SELECT * FROM t WHERE x = {y}")''',
 class TestSmartTestsGenerateTool:
     """Tests for smart_tests_generate tool."""
 
-    @pytest.fixture
-    def server(self):
-        return create_server()
-
-    @pytest.mark.asyncio
-    async def test_smart_tests_generate_success(self, server):
+    async def test_smart_tests_generate_success(self, server, sample_py_file):
         """Test smart_tests_generate with a valid file."""
-        # Create a temporary Python file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write('''
-def hello(name: str) -> str:
-    """Say hello."""
-    return f"Hello, {name}"
-''')
-            temp_path = f.name
-
-        try:
-            result = await call_tool(server, "smart_tests_generate", {
-                "file_path": temp_path,
-            })
-
-            data = json.loads(result[0].text)
-            assert data["success"] is True
-            assert data["file_path"] == temp_path
-            assert "test_code" in data
-            assert "def test_hello" in data["test_code"]
-            assert data["lines"] > 0
-        finally:
-            os.unlink(temp_path)
-
-    @pytest.mark.asyncio
-    async def test_smart_tests_generate_file_not_found(self, server):
-        """Test smart_tests_generate with non-existent file."""
         result = await call_tool(server, "smart_tests_generate", {
-            "file_path": "/nonexistent/path/to/file.py",
+            "file_path": sample_py_file,
         })
 
         data = json.loads(result[0].text)
+        assert data["success"] is True
+        assert data["file_path"] == sample_py_file
+        assert "test_code" in data
+        assert "def test_hello" in data["test_code"]
+        assert data["lines"] > 0
+
+    def test_smart_tests_generate_file_not_found(self, server):
+        """Test smart_tests_generate with non-existent file."""
+        data = call_tool_raw(server, "smart_tests_generate", {
+            "file_path": "/nonexistent/path/to/file.py",
+        })
+
         assert data["success"] is False
         assert "error" in data
         assert "not found" in data["error"].lower() or "File not found" in data["error"]
 
-    @pytest.mark.asyncio
-    async def test_smart_tests_generate_not_python(self, server):
+    def test_smart_tests_generate_not_python(self, server, sample_txt_file):
         """Test smart_tests_generate with non-Python file."""
-        # Create a temporary non-Python file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("This is not Python")
-            temp_path = f.name
-
-        try:
-            result = await call_tool(server, "smart_tests_generate", {
-                "file_path": temp_path,
-            })
-
-            data = json.loads(result[0].text)
-            assert data["success"] is False
-            assert "error" in data
-            assert ".py" in data["error"]
-        finally:
-            os.unlink(temp_path)
-
-    @pytest.mark.asyncio
-    async def test_smart_tests_generate_exception(self, server):
+        data = call_tool_raw(server, "smart_tests_generate", {
+            "file_path": sample_txt_file,
+        })
+
+        assert data["success"] is False
+        assert "error" in data
+        assert ".py" in data["error"]
+
+    def test_smart_tests_generate_exception(self, server, broken_py_file):
         """Test smart_tests_generate handles exceptions."""
-        # Create a file with invalid Python syntax
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write("def broken(:\n    pass")  # Invalid syntax
-            temp_path = f.name
-
-        try:
-            result = await call_tool(server, "smart_tests_generate", {
-                "file_path": temp_path,
-            })
-
-            data = json.loads(result[0].text)
-            assert data["success"] is False
-            assert "error" in data
-            assert data["file_path"] == temp_path
-        finally:
-            os.unlink(temp_path)
-
-    @pytest.mark.asyncio
-    async def test_smart_tests_generate_file_too_large(self):
+        data = call_tool_raw(server, "smart_tests_generate", {
+            "file_path": broken_py_file,
+        })
+
+        assert data["success"] is False
+        assert "error" in data
+        assert data["file_path"] == broken_py_file
+
+    def test_smart_tests_generate_file_too_large(self, tmp_path):
         """Test smart_tests_generate rejects files exceeding max_file_bytes."""
         from brain_dev.config import DevBrainConfig
 
@@ -304,17 +229,12 @@ def hello(name: str) -> str:
         small_config = DevBrainConfig(max_file_bytes=500)
         server = create_server(small_config)
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write("x = 1\n" * 200)  # ~1200 bytes, over 500 cap
-            temp_path = f.name
+        big_file = tmp_path / "big.py"
+        big_file.write_text("x = 1\n" * 200)  # ~1200 bytes, over 500 cap
 
-        try:
-            result = await call_tool(server, "smart_tests_generate", {
-                "file_path": temp_path,
-            })
+        data = call_tool_raw(server, "smart_tests_generate", {
+            "file_path": str(big_file),
+        })
 
-            data = json.loads(result[0].text)
-            assert data["success"] is False
-            assert "too large" in data["error"].lower() or "File too large" in data["error"]
-        finally:
-            os.unlink(temp_path)
+        assert data["success"] is False
+        assert "too large" in data["error"].lower() or "File too large" in data["error"]
@@ -0,0 +1,171 @@
+"""
+Tests for RefactorAnalyzer.
+"""
+
+from types import MappingProxyType
+
+from brain_dev.analyzer import RefactorSuggestion
+
+# Six nested control-flow statements: enough to trip the complexity threshold.
+_NESTED_SOURCE = (
+    "def f(x, y, z):\n"
+    "    if x:\n"
+    "        if y:\n"
+    "            if z:\n"
+    "                for i in x:\n"
+    "                    for j in y:\n"
+    "                        while True:\n"
+    "                            pass\n"
+)
+
+# Read-only symbol payloads shared by several tests; the analyzer only reads them.
+_COMPLEX_SYMBOL = MappingProxyType({
+    "name": "complex_function",
+    "file_path": "handler.py",
+    "line": 50,
+    "source_code": _NESTED_SOURCE,
+})
+_SINGLE_LETTER_SYMBOL = MappingProxyType(
+    {"name": "x", "symbol_type": "variable", "file_path": "a.py", "line": 10}
+)
+
+
+# =============================================================================
+# RefactorAnalyzer Tests
+# =============================================================================
+
+class TestRefactorAnalyzer:
+    """Tests for RefactorAnalyzer."""
+
+    def test_create_analyzer(self, refactor_analyzer):
+        """Test creating refactor analyzer."""
+        assert refactor_analyzer is not None
+
+    def test_analyze_complexity(self, refactor_analyzer):
+        """Test complexity analysis."""
+        suggestions = refactor_analyzer.analyze_code([_COMPLEX_SYMBOL], [], "complexity")
+
+        assert isinstance(suggestions, list)
+        assert len(suggestions) >= 1
+        for s in suggestions:
+            assert isinstance(s, RefactorSuggestion)
+            assert s.suggestion_type == "reduce_complexity"
+            assert s.confidence > 0
+
+    def test_analyze_duplication(self, refactor_analyzer):
+        """Test duplication analysis."""
+        symbols = [
+            {"name": "handler1", "file_path": "a.py"},
+            {"name": "handler2", "file_path": "a.py"},
+            {"name": "handler3", "file_path": "a.py"},
+        ]
+        suggestions = refactor_analyzer.analyze_code(symbols, [], "duplication")
+
+        assert isinstance(suggestions, list)
+        for s in suggestions:
+            assert s.suggestion_type == "extract_common"
+
+    def test_analyze_naming(self, refactor_analyzer):
+        """Test naming analysis."""
+        suggestions = refactor_analyzer.analyze_code([_SINGLE_LETTER_SYMBOL], [], "naming")
+
+        assert isinstance(suggestions, list)
+        for s in suggestions:
+            assert s.suggestion_type == "rename"
+
+    def test_analyze_all_types(self, refactor_analyzer, sample_code_symbols):
+        """Test analyzing all refactoring types."""
+        suggestions = refactor_analyzer.analyze_code(
+            sample_code_symbols, [], "all"
+        )
+
+        # analyze_code only handles one type at a time, "all" not implemented
+        # So it returns empty for unknown type
+        assert isinstance(suggestions, list)
+
+    def test_analyze_with_patterns(
+        self, refactor_analyzer, sample_code_symbols, sample_patterns
+    ):
+        """Test analysis with usage patterns."""
+        suggestions = refactor_analyzer.analyze_code(
+            sample_code_symbols, sample_patterns, "complexity"
+        )
+
+        # Should still return valid suggestions
+        assert isinstance(suggestions, list)
+
+    def test_analyze_empty_symbols(self, refactor_analyzer):
+        """Test with no symbols."""
+        suggestions = refactor_analyzer.analyze_code([], [], "complexity")
+        assert suggestions == []
+
+    def test_suggestions_have_target_info(self, refactor_analyzer):
+        """Test that suggestions include target information."""
+        suggestions = refactor_analyzer.analyze_code([_COMPLEX_SYMBOL], [], "complexity")
+
+        for s in suggestions:
+            assert s.location is not None
+
+    def test_complexity_ignores_comments_and_strings(self, refactor_analyzer):
+        """Regression: 'if' inside comments/strings must not inflate complexity."""
+        symbols = [
+            {
+                "name": "misleading",
+                "source_code": (
+                    "def f():\n"
+                    "    # if x: if y: if z: for i in range(10): while True:\n"
+                    '    s = "if x: for y in z: while True: elif: except:"\n'
+                    "    return s\n"
+                ),
+            }
+        ]
+        suggestions = refactor_analyzer.analyze_code(symbols, [], "complexity")
+        # No real control flow → no suggestion expected
+        assert len(suggestions) == 0
+
+    def test_complexity_counts_nested_control_flow(self, refactor_analyzer):
+        """Test that nested real control flow is counted correctly."""
+        code = (
+            "def nested():\n"
+            "    if a:\n"            # +1
+            "        for x in b:\n"  # +1
+            "            while c:\n"  # +1
+            "                try:\n"  # +1
+            "                    with f():\n"  # +1
+            "                        if d or e:\n"  # +1 (If) + 1 (BoolOp 2 values)
+            "                            pass\n"
+            "                except ValueError:\n"  # +1 (ExceptHandler)
+            "                    pass\n"
+        )
+        score = refactor_analyzer._ast_complexity(code)
+        assert score == 8  # If + For + While + Try + With + If + BoolOp(1) + ExceptHandler
+
+    def test_complexity_counts_comprehensions(self, refactor_analyzer):
+        """Test that comprehensions contribute to complexity."""
+        code = (
+            "def f(data):\n"
+            "    a = [x for x in data]\n"       # +1 ListComp
+            "    b = {x: 1 for x in data}\n"    # +1 DictComp
+            "    c = {x for x in data}\n"        # +1 SetComp
+            "    d = sum(x for x in data)\n"     # +1 GeneratorExp
+            "    if a:\n"                         # +1 If
+            "        for i in b:\n"               # +1 For
+            "            pass\n"
+        )
+        score = refactor_analyzer._ast_complexity(code)
+        assert score == 6
+
+    def test_complexity_counts_match_cases(self, refactor_analyzer):
+        """Test that each match/case arm contributes to complexity."""
+        code = (
+            "def f(cmd):\n"
+            "    match cmd:\n"
+            "        case 'start':\n"  # +1
+            "            pass\n"
+            "        case 'stop':\n"   # +1
+            "            pass\n"
+            "        case _:\n"        # +1
+            "            pass\n"
+        )
+        score = refactor_analyzer._ast_complexity(code)
+        assert score == 3
@@ -4,7 +4,7 @@ Tests for Dev Brain MCP Server.
 
 import json
 import pytest
-from unittest.mock import MagicMock, AsyncMock
+from types import SimpleNamespace
 
 from mcp.types import (
     Tool,
@@ -16,7 +16,6 @@ from mcp.types import (
     ReadResourceRequest,
 )
 
-from brain_dev.config import DevBrainConfig
 from brain_dev.server import create_server, TOOL_DEFINITIONS
 
 
@@ -27,7 +26,7 @@ from brain_dev.server import create_server, TOOL_DEFINITIONS
 async def list_tools(server) -> list[Tool]:
     """List tools from server."""
     handler = server.request_handlers[ListToolsRequest]
-    request = MagicMock()
+    request = SimpleNamespace(params=None)
     result = await handler(request)
     return result.root.tools
 
@@ -35,10 +34,7 @@ async def list_tools(server) -> list[Tool]:
 async def call_tool(server, name: str, arguments: dict) -> list[TextContent]:
     """Call a tool on the server."""
     handler = server.request_handlers[CallToolRequest]
-    request = MagicMock()
-    request.params = MagicMock()
-    request.params.name = name
-    request.params.arguments = arguments
+    request = SimpleNamespace(params=SimpleNamespace(name=name, arguments=arguments))
     result = await handler(request)
     return result.root.content
 
@@ -46,7 +42,7 @@ async def call_tool(server, name: str, arguments: dict) -> list[TextContent]:
 async def list_resources(server) -> list[Resource]:
     """List resources from server."""
     handler = server.request_handlers[ListResourcesRequest]
-    request = MagicMock()
+    request = SimpleNamespace(params=None)
     result = await handler(request)
     return result.root.resources
 
@@ -54,9 +50,7 @@ async def list_resources(server) -> list[Resource]:
 async def read_resource(server, uri: str) -> str:
     """Read a resource from server."""
     handler = server.request_handlers[ReadResourceRequest]
-    request = MagicMock()
-    request.params = MagicMock()
-    request.params.uri = uri
+    request = SimpleNamespace(params=SimpleNamespace(uri=uri))
     result = await handler(request)
     # MCP wraps the result, extract the text content
     contents = result.root.contents
@@ -90,6 +84,23 @@ class TestServerCreation:
         assert ListResourcesRequest in server.request_handlers
         assert ReadResourceRequest in server.request_handlers
 
+    def test_create_server_does_not_import_analyzers(self):
+        """Test that analyzer modules load on first tool call, not at startup."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from brain_dev.server import create_server\n"
+            "create_server()\n"
+            "loaded = {'brain_dev.analyzer', 'brain_dev.smart_test_generator'}\n"
+            "print(sorted(loaded & set(sys.modules)))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
 
 # =============================================================================
 # Tool Listing Tests
@@ -98,7 +109,6 @@ class TestServerCreation:
 class TestListTools:
     """Tests for listing tools."""
 
-    @pytest.mark.asyncio
     async def test_list_tools_returns_all_tools(self, server):
         """Test that all expected tools are listed."""
         tools = await list_tools(server)
@@ -117,7 +127,6 @@ class TestListTools:
         }
         assert tool_names == expected
 
-    @pytest.mark.asyncio
     async def test_tool_registry_matches_listed_tools(self, server):
         """Regression: TOOL_DEFINITIONS registry must match listed tools exactly."""
         tools = await list_tools(server)
@@ -127,14 +136,12 @@ class TestListTools:
         assert registry_names == listed_names
         assert len(TOOL_DEFINITIONS) == len(tools)
 
-    @pytest.mark.asyncio
     async def test_brain_stats_reports_correct_tool_count(self, server):
         """Regression: brain_stats must reflect actual tool count, not hardcoded."""
         result = await call_tool(server, "brain_stats", {})
         data = json.loads(result[0].text)
         assert data["tools_available"] == len(TOOL_DEFINITIONS)
 
-    @pytest.mark.asyncio
     async def test_tools_have_descriptions(self, server):
         """Test that all tools have descriptions."""
         tools = await list_tools(server)
@@ -143,7 +150,6 @@ class TestListTools:
             assert tool.description is not None
             assert len(tool.description) > 0
 
-    @pytest.mark.asyncio
     async def test_tools_have_input_schemas(self, server):
         """Test that all tools have input schemas."""
         tools = await list_tools(server)
@@ -161,7 +167,6 @@ class TestListTools:
 class TestCoverageAnalyzeTool:
     """Tests for coverage_analyze tool."""
 
-    @pytest.mark.asyncio
     async def test_coverage_analyze_basic(self, server, sample_patterns):
         """Test basic coverage analysis."""
         result = await call_tool(server, "coverage_analyze", {
@@ -177,7 +182,6 @@ class TestCoverageAnalyzeTool:
         assert "gaps_found" in data
         assert "gaps" in data
 
-    @pytest.mark.asyncio
     async def test_coverage_analyze_with_test_patterns(
         self, server, sample_patterns, sample_test_patterns
     ):
@@ -193,7 +197,6 @@ class TestCoverageAnalyzeTool:
         assert data["covered_flows"] > 0
         assert data["coverage_percentage"] > 0
 
-    @pytest.mark.asyncio
     async def test_coverage_analyze_custom_min_support(
         self, server, sample_patterns
     ):
@@ -209,7 +212,6 @@ class TestCoverageAnalyzeTool:
         for gap in data["gaps"]:
             assert gap["support"] >= 0.20
 
-    @pytest.mark.asyncio
     async def test_coverage_analyze_empty_patterns(self, server):
         """Test coverage analysis with empty patterns."""
         result = await call_tool(server, "coverage_analyze", {
@@ -228,7 +230,6 @@ class TestCoverageAnalyzeTool:
 class TestBehaviorMissingTool:
     """Tests for behavior_missing tool."""
 
-    @pytest.mark.asyncio
     async def test_behavior_missing_basic(self, server, sample_patterns):
         """Test basic missing behavior detection."""
         result = await call_tool(server, "behavior_missing", {
@@ -241,7 +242,6 @@ class TestBehaviorMissingTool:
         assert "missing_behaviors" in data
         assert "total_found" in data
 
-    @pytest.mark.asyncio
     async def test_behavior_missing_with_code_symbols(
         self, server, sample_patterns, sample_code_symbols
     ):
@@ -254,7 +254,6 @@ class TestBehaviorMissingTool:
         data = json.loads(result[0].text)
         assert "missing_behaviors" in data
 
-    @pytest.mark.asyncio
     async def test_behavior_missing_custom_min_count(
         self, server, sample_patterns
     ):
@@ -270,7 +269,6 @@ class TestBehaviorMissingTool:
         for behavior in data["missing_behaviors"]:
             assert behavior["observed_count"] >= 50
 
-    @pytest.mark.asyncio
     async def test_behavior_missing_empty_patterns(self, server):
         """Test missing behavior with empty patterns."""
         result = await call_tool(server, "behavior_missing", {
@@ -288,7 +286,6 @@ class TestBehaviorMissingTool:
 class TestTestsGenerateTool:
     """Tests for tests_generate tool."""
 
-    @pytest.mark.asyncio
     async def test_tests_generate_basic(self, server, sample_gap):
         """Test basic test generation."""
         result = await call_tool(server, "tests_generate", {
@@ -303,7 +300,6 @@ class TestTestsGenerateTool:
         assert "test_code" in data
         assert "framework" in data
 
-    @pytest.mark.asyncio
     async def test_tests_generate_pytest(self, server, sample_gap):
         """Test generating pytest tests."""
         result = await call_tool(server, "tests_generate", {
@@ -315,7 +311,6 @@ class TestTestsGenerateTool:
         assert data["framework"] == "pytest"
         assert "def test_" in data["test_code"]
 
-    @pytest.mark.asyncio
     async def test_tests_generate_jest(self, server, sample_gap):
         """Test generating Jest tests."""
         result = await call_tool(server, "tests_generate", {
@@ -326,7 +321,6 @@ class TestTestsGenerateTool:
         data = json.loads(result[0].text)
         assert data["framework"] == "jest"
 
-    @pytest.mark.asyncio
     async def test_tests_generate_go(self, server, sample_gap):
         """Test generating Go tests."""
         result = await call_tool(server, "tests_generate", {
@@ -339,7 +333,6 @@ class TestTestsGenerateTool:
         # Go template not defined, falls back to TODO comment
         assert len(data["test_code"]) > 0
 
-    @pytest.mark.asyncio
     async def test_tests_generate_integration_style(self, server, sample_gap):
         """Test generating integration style tests."""
         result = await call_tool(server, "tests_generate", {
@@ -350,7 +343,6 @@ class TestTestsGenerateTool:
         data = json.loads(result[0].text)
         assert data["style"] == "integration"
 
-    @pytest.mark.asyncio
     async def test_tests_generate_e2e_style(self, server, sample_gap):
         """Test generating e2e style tests."""
         result = await call_tool(server, "tests_generate", {
@@ -369,7 +361,6 @@ class TestTestsGenerateTool:
 class TestRefactorSuggestTool:
     """Tests for refactor_suggest tool."""
 
-    @pytest.mark.asyncio
     async def test_refactor_suggest_basic(self, server, sample_code_symbols):
         """Test basic refactoring suggestions."""
         result = await call_tool(server, "refactor_suggest", {
@@ -382,7 +373,6 @@ class TestRefactorSuggestTool:
         assert "suggestions" in data
         assert "total_found" in data
 
-    @pytest.mark.asyncio
     async def test_refactor_suggest_complexity(self, server, sample_code_symbols):
         """Test complexity analysis."""
         result = await call_tool(server, "refactor_suggest", {
@@ -395,7 +385,6 @@ class TestRefactorSuggestTool:
         for s in data["suggestions"]:
             assert s["suggestion_type"] == "complexity"
 
-    @pytest.mark.asyncio
     async def test_refactor_suggest_duplication(self, server, sample_code_symbols):
         """Test duplication analysis."""
         result = await call_tool(server, "refactor_suggest", {
@@ -408,7 +397,6 @@ class TestRefactorSuggestTool:
         for s in data["suggestions"]:
             assert s["suggestion_type"] == "duplication"
 
-    @pytest.mark.asyncio
     async def test_refactor_suggest_naming(self, server, sample_code_symbols):
         """Test naming analysis."""
         result = await call_tool(server, "refactor_suggest", {
@@ -421,7 +409,6 @@ class TestRefactorSuggestTool:
         for s in data["suggestions"]:
             assert s["suggestion_type"] == "naming"
 
-    @pytest.mark.asyncio
     async def test_refactor_suggest_with_patterns(
         self, server, sample_code_symbols, sample_patterns
     ):
@@ -434,7 +421,6 @@ class TestRefactorSuggestTool:
         data = json.loads(result[0].text)
         assert "suggestions" in data
 
-    @pytest.mark.asyncio
     async def test_refactor_suggest_empty_symbols(self, server):
         """Test refactoring with empty symbols."""
         result = await call_tool(server, "refactor_suggest", {
@@ -452,7 +438,6 @@ class TestRefactorSuggestTool:
 class TestUXInsightsTool:
     """Tests for ux_insights tool."""
 
-    @pytest.mark.asyncio
     async def test_ux_insights_basic(self, server, sample_patterns):
         """Test basic UX insights."""
         result = await call_tool(server, "ux_insights", {
@@ -467,7 +452,6 @@ class TestUXInsightsTool:
         assert "flow_type" in data
         assert "metric" in data
 
-    @pytest.mark.asyncio
     async def test_ux_insights_dropoff(self, server, sample_patterns):
         """Test dropoff metric analysis."""
         result = await call_tool(server, "ux_insights", {
@@ -481,7 +465,6 @@ class TestUXInsightsTool:
         for i in data["insights"]:
             assert i["metric"] == "dropoff"
 
-    @pytest.mark.asyncio
     async def test_ux_insights_error_rate(self, server, sample_patterns):
         """Test error rate metric analysis."""
         result = await call_tool(server, "ux_insights", {
@@ -495,7 +478,6 @@ class TestUXInsightsTool:
         for i in data["insights"]:
             assert i["metric"] == "error_rate"
 
-    @pytest.mark.asyncio
     async def test_ux_insights_checkout_flow(self, server, sample_patterns):
         """Test checkout flow analysis."""
         result = await call_tool(server, "ux_insights", {
@@ -506,7 +488,6 @@ class TestUXInsightsTool:
         data = json.loads(result[0].text)
         assert data["flow_type"] == "checkout"
 
-    @pytest.mark.asyncio
     async def test_ux_insights_search_flow(self, server, sample_patterns):
         """Test search flow analysis."""
         result = await call_tool(server, "ux_insights", {
@@ -517,7 +498,6 @@ class TestUXInsightsTool:
         data = json.loads(result[0].text)
         assert data["flow_type"] == "search"
 
-    @pytest.mark.asyncio
     async def test_ux_insights_empty_patterns(self, server):
         """Test UX insights with empty patterns."""
         result = await call_tool(server, "ux_insights", {
@@ -535,7 +515,6 @@ class TestUXInsightsTool:
 class TestBrainStatsTool:
     """Tests for brain_stats tool."""
 
-    @pytest.mark.asyncio
     async def test_brain_stats(self, server):
         """Test getting server stats."""
         result = await call_tool(server, "brain_stats", {})
@@ -548,7 +527,6 @@ class TestBrainStatsTool:
         assert "tools_available" in data
         assert data["tools_available"] == 9
 
-    @pytest.mark.asyncio
     async def test_brain_stats_config_values(self, server):
         """Test that stats include config values."""
         result = await call_tool(server, "brain_stats", {})
@@ -569,7 +547,6 @@ class TestBrainStatsTool:
 class TestUnknownTool:
     """Tests for unknown tool handling."""
 
-    @pytest.mark.asyncio
     async def test_unknown_tool_returns_error(self, server):
         """Test that unknown tool returns error message."""
         result = await call_tool(server, "unknown_tool", {})
@@ -585,7 +562,6 @@ class TestUnknownTool:
 class TestResources:
     """Tests for resources."""
 
-    @pytest.mark.asyncio
     async def test_list_resources(self, server):
         """Test listing resources."""
         resources = await list_resources(server)
@@ -595,7 +571,6 @@ class TestResources:
         uris = {str(r.uri) for r in resources}
         assert "brain://stats" in uris
 
-    @pytest.mark.asyncio
     async def test_read_brain_stats_resource(self, server):
         """Test reading brain stats resource."""
         text = await read_resource(server, "brain://stats")
@@ -606,7 +581,6 @@ class TestResources:
         assert "analyzers" in data
         assert len(data["analyzers"]) == 5
 
-    @pytest.mark.asyncio
     async def test_read_unknown_resource(self, server):
         """Test reading unknown resource."""
         text = await read_resource(server, "brain://unknown")
@@ -622,7 +596,6 @@ class TestResources:
 class TestIntegration:
     """Integration tests for typical workflows."""
 
-    @pytest.mark.asyncio
     async def test_coverage_to_test_generation_flow(
         self, server, sample_patterns, sample_test_patterns
     ):
@@ -651,7 +624,6 @@ class TestIntegration:
             assert test_data["test_code"] is not None
             assert "def test_" in test_data["test_code"]
 
-    @pytest.mark.asyncio
     async def test_behavior_analysis_flow(
         self, server, sample_patterns, sample_code_symbols
     ):
@@ -676,7 +648,6 @@ class TestIntegration:
         assert "missing_behaviors" in missing_data
         assert "suggestions" in refactor_data
 
-    @pytest.mark.asyncio
     async def test_ux_analysis_flow(self, server, sample_patterns):
         """Test UX analysis flow."""
         # Analyze multiple metrics
@@ -700,7 +671,6 @@ class TestIntegration:
         assert dropoff_data["metric"] == "dropoff"
         assert error_data["metric"] == "error_rate"
 
-    @pytest.mark.asyncio
     async def test_full_analysis_workflow(
         self, server, sample_patterns, sample_test_patterns, sample_code_symbols
     ):
@@ -774,56 +744,48 @@ class TestInputValidation:
 
     # -- Missing required arguments --
 
-    @pytest.mark.asyncio
     async def test_coverage_analyze_missing_patterns(self, server):
         result = await call_tool(server, "coverage_analyze", {})
         data = _parse_tool_result(result)
         assert data["success"] is False
         assert "patterns" in data["error"].lower()
 
-    @pytest.mark.asyncio
     async def test_behavior_missing_missing_patterns(self, server):
         result = await call_tool(server, "behavior_missing", {})
         data = _parse_tool_result(result)
         assert data["success"] is False
         assert "patterns" in data["error"].lower()
 
-    @pytest.mark.asyncio
     async def test_tests_generate_missing_gap(self, server):
         result = await call_tool(server, "tests_generate", {})
         data = _parse_tool_result(result)
         assert data["success"] is False
         assert "gap" in data["error"].lower()
 
-    @pytest.mark.asyncio
     async def test_refactor_suggest_missing_symbols(self, server):
         result = await call_tool(server, "refactor_suggest", {})
         data = _parse_tool_result(result)
         assert data["success"] is False
         assert "symbols" in data["error"].lower()
 
-    @pytest.mark.asyncio
     async def test_ux_insights_missing_patterns(self, server):
         result = await call_tool(server, "ux_insights", {})
         data = _parse_tool_result(result)
         assert data["success"] is False
         assert "patterns" in data["error"].lower()
 
-    @pytest.mark.asyncio
     async def test_smart_tests_generate_missing_file_path(self, server):
         result = await call_tool(server, "smart_tests_generate", {})
         data = _parse_tool_result(result)
         assert data["success"] is False
         assert "file_path" in data["error"].lower()
 
-    @pytest.mark.asyncio
     async def test_docs_generate_missing_symbols(self, server):
         result = await call_tool(server, "docs_generate", {})
         data = _parse_tool_result(result)
         assert data["success"] is False
         assert "symbols" in data["error"].lower()
 
-    @pytest.mark.asyncio
     async def test_security_audit_missing_symbols(self, server):
         result = await call_tool(server, "security_audit", {})
         data = _parse_tool_result(result)
@@ -832,28 +794,24 @@ class TestInputValidation:
 
     # -- Wrong type arguments --
 
-    @pytest.mark.asyncio
     async def test_coverage_analyze_wrong_type(self, server):
         result = await call_tool(server, "coverage_analyze", {"patterns": "not-a-list"})
         data = _parse_tool_result(result)
         assert data["success"] is False
         assert "array" in data["error"].lower() or "list" in data["error"].lower()
 
-    @pytest.mark.asyncio
     async def test_tests_generate_wrong_type(self, server):
         result = await call_tool(server, "tests_generate", {"gap": "not-a-dict"})
         data = _parse_tool_result(result)
         assert data["success"] is False
         assert "object" in data["error"].lower() or "dict" in data["error"].lower()
 
-    @pytest.mark.asyncio
     async def test_smart_tests_generate_wrong_type(self, server):
         result = await call_tool(server, "smart_tests_generate", {"file_path": 12345})
         data = _parse_tool_result(result)
         assert data["success"] is False
         assert "string" in data["error"].lower() or "type" in data["error"].lower()
 
-    @pytest.mark.asyncio
     async def test_refactor_suggest_wrong_type(self, server):
         result = await call_tool(server, "refactor_suggest", {"symbols": "not-a-list"})
         data = _parse_tool_result(result)
@@ -862,7 +820,6 @@ class TestInputValidation:
 
     # -- brain_stats accepts empty args (no required fields) --
 
-    @pytest.mark.asyncio
     async def test_brain_stats_no_args_ok(self, server):
         result = await call_tool(server, "brain_stats", {})
         data = json.loads(result[0].text)
@@ -912,3 +869,9 @@ class TestServiceSingletonFactory:
                 f"_get_service({name!r}) returned {type(instance).__name__}, "
                 f"expected {expected_type.__name__}"
             )
+
+    def test_tool_impls_cover_every_tool_definition(self):
+        """Every advertised tool has a raw handler that returns a plain dict."""
+        server = create_server()
+        assert set(server._tool_impls) == {t.name for t in TOOL_DEFINITIONS}
+        assert isinstance(server._tool_impls["brain_stats"]({}), dict)
@@ -5,7 +5,6 @@ Tests the AST-based code analysis and test generation.
 """
 
 import pytest
-from pathlib import Path
 
 from brain_dev.smart_test_generator import (
     Parameter,
@@ -191,6 +190,32 @@ from typing import Optional, List
         assert result.imports[1].module == "pathlib"
         assert "Path" in result.imports[1].names
 
+    def test_analyze_definitions_inside_blocks(self):
+        """Test that imports and defs nested in module-level blocks are found."""
+        source = '''
+try:
+    import ujson as json
+except ImportError:
+    import json
+
+if json:
+    def dumps(obj):
+        return json.dumps(obj)
+else:
+    class Fallback:
+        pass
+
+def outer():
+    def inner():
+        pass
+'''
+        analyzer = CodeAnalyzer(source, "test.py")
+        result = analyzer.analyze()
+
+        assert [i.module for i in result.imports] == ["ujson", "json"]
+        assert [f.name for f in result.functions] == ["dumps", "outer"]
+        assert [c.name for c in result.classes] == ["Fallback"]
+
     def test_analyze_decorated_function(self):
         """Test analyzing decorated function."""
         source = '''
@@ -556,6 +581,58 @@ async def fetch_data(url: str) -> dict:
         result = generate_tests_for_file(str(small_file), max_file_bytes=500)
         assert "Tests for" in result
 
+    def test_reuses_analysis_until_file_changes(self, tmp_path, monkeypatch):
+        """Test that analysis is cached per path and content."""
+        from brain_dev.smart_test_generator import _analyze_cached
+
+        calls = []
+        real_analyze = CodeAnalyzer.analyze
+
+        def counting_analyze(self):
+            calls.append(self.file_path)
+            return real_analyze(self)
+
+        monkeypatch.setattr(CodeAnalyzer, "analyze", counting_analyze)
+
+        test_file = tmp_path / "cached.py"
+        test_file.write_text("def first():\n    pass\n")
+
+        _analyze_cached(str(test_file), test_file.read_bytes())
+        _analyze_cached(str(test_file), test_file.read_bytes())
+        assert len(calls) == 1
+
+        test_file.write_text("def second():\n    pass\n")
+        result = generate_tests_for_file(str(test_file))
+
+        assert "def test_second" in result
+        assert "def test_first" not in result
+
+    def test_cached_analysis_tracks_package_layout(self, tmp_path):
+        """Test that adding __init__.py changes the import on the next call."""
+        package = tmp_path / "pkg"
+        package.mkdir()
+        module = package / "mod.py"
+        module.write_text("def greet():\n    pass\n")
+
+        assert "from mod import (" in generate_tests_for_file(str(module))
+
+        (package / "__init__.py").write_text("")
+
+        assert "from pkg.mod import (" in generate_tests_for_file(str(module))
+
+    def test_honours_source_encoding_declaration(self, tmp_path):
+        """Test that non-UTF-8 files with a coding cookie are parsed."""
+        test_file = tmp_path / "latin.py"
+        test_file.write_bytes(
+            b"# -*- coding: latin-1 -*-\n"
+            b"def caf\xe9():\n"
+            b"    pass\n"
+        )
+
+        result = generate_tests_for_file(str(test_file))
+
+        assert "def test_caf\u00e9" in result
+
 
 # ==========================================================================
 # Test Edge Cases
@@ -694,6 +771,12 @@ class TestStdlibWhitelist:
         from brain_dev.smart_test_generator import MockDetector
         assert MockDetector._is_stdlib("itertools") is True
 
+    def test_platform_specific_stdlib(self):
+        """Stdlib modules absent on this platform are still stdlib."""
+        from brain_dev.smart_test_generator import MockDetector
+        assert MockDetector._is_stdlib("winreg") is True
+        assert MockDetector._is_stdlib("msvcrt") is True
+
     def test_third_party_still_detected(self):
         """A truly third-party package must NOT be treated as stdlib."""
         from brain_dev.smart_test_generator import MockDetector
@@ -0,0 +1,124 @@
+"""
+Tests for the template-based CodeTestGenerator.
+"""
+
+from brain_dev.analyzer import CoverageGap
+
+
+# =============================================================================
+# TestGenerator Tests
+# =============================================================================
+
+class TestTestGeneratorClass:
+    """Tests for TestGenerator."""
+
+    def test_create_generator(self, test_generator):
+        """Test creating test generator."""
+        assert test_generator is not None
+
+    def test_generate_pytest_test(self, test_generator):
+        """Test generating pytest test."""
+        gap = CoverageGap(
+            gap_id="gap_001",
+            pattern=["login", "checkout"],
+            support=0.10,
+            priority="high",
+            suggested_test_name="test_login_checkout_flow",
+            suggested_test_file="tests/test_flow.py",
+            description="Login checkout flow",
+        )
+
+        suggestion = test_generator.generate_test(gap, "pytest", "unit")
+
+        assert suggestion.framework == "pytest"
+        assert suggestion.style == "unit"
+        assert "def test_" in suggestion.test_code
+        assert suggestion.covers_pattern == ["login", "checkout"]
+
+    def test_generate_jest_test(self, test_generator):
+        """Test generating Jest test."""
+        gap = CoverageGap(
+            gap_id="gap_002",
+            pattern=["search", "filter"],
+            support=0.10,
+            priority="medium",
+            suggested_test_name="test_search_filter",
+            suggested_test_file="tests/test_search.js",
+            description="Search filter flow",
+        )
+
+        suggestion = test_generator.generate_test(gap, "jest", "unit")
+
+        assert suggestion.framework == "jest"
+        assert "describe(" in suggestion.test_code or "test(" in suggestion.test_code
+
+    def test_generate_go_test(self, test_generator):
+        """Test generating Go test."""
+        gap = CoverageGap(
+            gap_id="gap_003",
+            pattern=["create", "delete"],
+            support=0.10,
+            priority="medium",
+            suggested_test_name="TestCreateDeleteFlow",
+            suggested_test_file="handler_test.go",
+            description="Create delete flow",
+        )
+
+        suggestion = test_generator.generate_test(gap, "go", "unit")
+
+        assert suggestion.framework == "go"
+        # Go framework not in templates — falls back to generic stub
+        assert "Write" in suggestion.test_code or "unit" in suggestion.test_code
+        assert suggestion.covers_pattern == ["create", "delete"]
+
+    def test_generate_integration_test(self, test_generator):
+        """Test generating integration test."""
+        gap = CoverageGap(
+            gap_id="gap_004",
+            pattern=["api_call", "response"],
+            support=0.10,
+            priority="medium",
+            suggested_test_name="test_api_call_response",
+            suggested_test_file="tests/test_api.py",
+            description="API call flow",
+        )
+
+        suggestion = test_generator.generate_test(gap, "pytest", "integration")
+
+        assert suggestion.style == "integration"
+        assert "integration" in suggestion.test_code.lower()
+
+    def test_generate_e2e_test(self, test_generator):
+        """Test generating e2e test."""
+        gap = CoverageGap(
+            gap_id="gap_005",
+            pattern=["start", "end"],
+            support=0.10,
+            priority="medium",
+            suggested_test_name="test_start_end_flow",
+            suggested_test_file="tests/test_e2e.py",
+            description="Start to end flow",
+        )
+
+        suggestion = test_generator.generate_test(gap, "pytest", "e2e")
+
+        assert suggestion.style == "e2e"
+        # e2e not in templates, should get fallback
+        assert len(suggestion.test_code) > 0
+
+    def test_generated_test_includes_pattern_steps(self, test_generator):
+        """Test that generated test references pattern in covers_pattern."""
+        gap = CoverageGap(
+            gap_id="gap_006",
+            pattern=["login", "dashboard", "logout"],
+            support=0.10,
+            priority="medium",
+            suggested_test_name="test_login_dashboard_logout_flow",
+            suggested_test_file="tests/test_flow.py",
+            description="Login dashboard logout flow",
+        )
+
+        suggestion = test_generator.generate_test(gap, "pytest", "unit")
+
+        # Suggestion should reference the pattern
+        assert suggestion.covers_pattern == ["login", "dashboard", "logout"]
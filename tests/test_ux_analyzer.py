@@ -0,0 +1,60 @@
+"""
+Tests for UXAnalyzer.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def flow_insights(ux_analyzer, sample_patterns):
+    """Memoized ``analyze_flow`` results over sample_patterns, keyed by (flow_type, metric)."""
+    cache = {}
+
+    def get(flow_type, metric):
+        key = (flow_type, metric)
+        if key not in cache:
+            cache[key] = ux_analyzer.analyze_flow(sample_patterns, flow_type, metric)
+        return cache[key]
+
+    return get
+
+
+# =============================================================================
+# UXAnalyzer Tests
+# =============================================================================
+
+class TestUXAnalyzer:
+    """Tests for UXAnalyzer."""
+
+    def test_create_analyzer(self, ux_analyzer):
+        """Test creating UX analyzer."""
+        assert ux_analyzer is not None
+
+    @pytest.mark.parametrize("flow_type,metric", [
+        ("general", "dropoff"),
+        ("general", "error_rate"),
+        ("checkout", "dropoff"),
+        ("search", "dropoff"),
+        ("onboarding", "dropoff"),
+    ])
+    def test_analyze_flow(self, flow_insights, flow_type, metric):
+        """Test flow analysis for each flow type / metric combination."""
+        insights = flow_insights(flow_type, metric)
+
+        assert isinstance(insights, list)
+        for i in insights:
+            assert i.metric == metric
+            assert i.confidence > 0
+
+    def test_analyze_empty_patterns(self, ux_analyzer):
+        """Test with empty patterns."""
+        insights = ux_analyzer.analyze_flow([], "general", "dropoff")
+        assert insights == []
+
+    def test_insights_have_suggestion_and_finding(self, flow_insights):
+        """Test that insights include a finding and an improvement suggestion."""
+        insights = flow_insights("general", "dropoff")
+
+        for i in insights:
+            assert i.finding is not None
+            assert i.suggestion is not None